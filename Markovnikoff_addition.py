@@ -1,8 +1,14 @@
 from chanim import *
+from checkpoints import CheckpointMixin
+from chem_cache import CachedChemObject as ChemObject
+from curves import MoveAlongCurve
+from molecules import molecule
+from rendering import enable_shared_render_cache
 # from periodic_table import PeriodicTable
 
 OUTPUT_DIRECTORY = "KilaCoda/markovnikoff"
 config.tex_template = TexTemplateLibrary.simple
+enable_shared_render_cache()
 
 ## Silly common constructs
 class InductiveArrows(VMobject):
@@ -110,7 +116,7 @@ class AlcoholsArePrettyImportant(Scene):
 
 
     def construct(self):
-        alc_general = ChemWithName("R-OH","Alcohols")
+        alc_general = ChemWithName(ChemObject("R-OH"),"Alcohols")
         self.play(alc_general.creation_anim());self.wait(2)
 
         self.play(
@@ -151,7 +157,7 @@ class AlcoholsArePrettyImportant(Scene):
         for chem,name,usage in zip(chems,names,usages):
             cases.add(
                 VGroup(
-                    ChemWithName(chem,name),CArrow(),TextMobject(usage)
+                    ChemWithName(ChemObject(chem),name),CArrow(),TextMobject(usage)
                 ).arrange(RIGHT)
             )
 
@@ -162,7 +168,7 @@ class AlcoholsArePrettyImportant(Scene):
         examples = VGroup()
 
         for chem in chems_and_names:
-            examples.add(ChemWithName(chem,chems_and_names[chem]).scale(0.75))
+            examples.add(ChemWithName(ChemObject(chem),chems_and_names[chem]).scale(0.75))
         return examples
 
 
@@ -262,7 +268,7 @@ class NormalMarksAddition(Scene):
         );self.wait()
 
         cleaner_final = ChemWithName(
-            "CH_3 - CH (-[2]Br) - CH_3",
+            molecule("2-bromopropane"),
             "2-bromopropane"
         )
 
@@ -370,7 +376,7 @@ class NormalMarksAdditionWithoutFootnote(Scene):
         );self.wait()
 
         cleaner_final = ChemWithName(
-            "CH_3 - CH (-[2]Br) - CH_3",
+            molecule("2-bromopropane"),
             "2-bromopropane"
         )
 
@@ -564,7 +570,7 @@ class Step0(Scene):
         H_to_X = CurvedArrow(H.get_top(),Br.get_top()).flip(RIGHT).scale(0.75).shift(UP)
         self.play(ShowCreation(H_to_X))
         self.play(H_elecs.move_to,H_to_X.get_start())
-        self.play(MoveAlongPath(H_elecs,H_to_X),
+        self.play(MoveAlongCurve(H_elecs,H_to_X),
                   FadeOut(
                       VGroup(
                           partial_pos,
@@ -623,9 +629,9 @@ class EmphasizeStep1(EmphasizeStepTemplate):
         "unfaded_index":1
     }
 
-class Step1(Scene):
+class Step1(CheckpointMixin, Scene):
     def construct(self):
-        alkene = ChemWithName("CH_3-CH=CH_2","Prop-1-ene",id="alkene")
+        alkene = ChemWithName(molecule("prop-1-ene"),"Prop-1-ene",id="alkene")
 
         self.play(alkene.creation_anim());self.wait(2)
         self.play(FadeOut(alkene.name))
@@ -663,12 +669,20 @@ class Step1(Scene):
         );self.wait(5)
 
         self.set_variables_as_attrs(alkene,option_1,option_2,bond_electrons,electrophile)
+        self.checkpoint(
+            "end",
+            alkene=alkene,
+            option_1=option_1,
+            option_2=option_2,
+            bond_electrons=bond_electrons,
+            electrophile=electrophile,
+        )
 
 class BetterCarbocations(Scene):
     def construct(self):
-        one_degree=ChemObject("R-\\charge{90:4pt=$+$}{C}H_2")
-        two_degree=ChemObject("R-\\charge{90:4pt=$+$}{C}H-R'")
-        three_degree=ChemObject("R-\\charge{60:4pt=$+$}{C}(-[2]R')-R''")
+        one_degree=molecule("general_primary_carbocation")
+        two_degree=molecule("general_secondary_carbocation")
+        three_degree=molecule("general_tertiary_carbocation")
 
 
 
@@ -713,7 +727,7 @@ class BetterCarbocations(Scene):
 
 class Path1(Step1):
     def construct(self):
-        super().construct()
+        self.resume_from(Step1, "end")
 
         self.option_2.set_opacity(0)
 
@@ -721,16 +735,14 @@ class Path1(Step1):
         # print_family(self.alkene)
         self.wait()
         self.play(
-            MoveAlongPath(
+            MoveAlongCurve(
                 self.electrophile,self.option_1,run_time=3,rate_func=smooth
             ),
             self.option_1.set_opacity,0
         );self.wait(2)
         print(self.foreground_mobjects)
 
-        carbocation = ChemObject(
-            "CH_3-CH(-[-2]H)-\\charge{90:4pt=$\\oplus$}{C}H_2"
-        )
+        carbocation = molecule("primary_carbocation")
 
         #
         carbocation[0][6].set_color(RED) #Hydrogen
@@ -756,22 +768,20 @@ class Path2(Step1):
     """This is basically a copy of Path1 with parameters changed. :P"""
 
     def construct(self):
-        super().construct()
+        self.resume_from(Step1, "end")
 
         self.option_1.set_opacity(0)
 
         self.wait()
         self.play(
-            MoveAlongPath(
+            MoveAlongCurve(
                 self.electrophile,self.option_2,run_time=3,rate_func=smooth
             ),
             self.option_2.set_opacity,0
         );self.wait(2)
         # print(self.foreground_mobjects)
 
-        carbocation = ChemObject(
-            "CH_3-\\charge{90:4pt=$\\oplus$}{C}H-CH_2(-[-2]H)"
-        )
+        carbocation = molecule("secondary_carbocation")
         #
         carbocation[0][11].set_color(RED) #Hydrogen
         carbocation[0][12].set_color_by_gradient(WHITE,WHITE,WHITE,RED) #Bond
@@ -794,18 +804,14 @@ class Path2(Step1):
 
 class BetterCarbocationHere(Scene):
     def construct(self):
-        first_degree = ChemObject(
-            "CH_3-CH(-[-2]H)-\\charge{90:4pt=$\\oplus$}{C}H_2"
-        ).shift(RIGHT*2.5)
+        first_degree = molecule("primary_carbocation").shift(RIGHT*2.5)
 
         #
         first_degree[0][6].set_color(RED) #Hydrogen
         first_degree[0][7].set_color_by_gradient(WHITE,WHITE,WHITE,RED) #Bond
         first_degree[0][9].set_color(GREEN) #Positive charge
 
-        second_degree = ChemObject(
-            "CH_3-\\charge{90:4pt=$\\oplus$}{C}H-CH_2(-[-2]H)"
-        )
+        second_degree = molecule("secondary_carbocation")
         #
         second_degree[0][11].set_color(RED) #Hydrogen
         second_degree[0][12].set_color_by_gradient(WHITE,WHITE,WHITE,RED) #Bond
@@ -858,9 +864,9 @@ class DetourOnStabilityOfCarbocations(Scene):
     """Maybe make this a video of it's own instead?
     """
     def construct(self):
-        one_degree=ChemObject("R-\\charge{90:4pt=$+$}{C}H_2")
-        two_degree=ChemObject("R-\\charge{90:4pt=$+$}{C}H-R'")
-        three_degree=ChemObject("R-\\charge{60:4pt=$+$}{C}(-[2]R')-R''")
+        one_degree=molecule("general_primary_carbocation")
+        two_degree=molecule("general_secondary_carbocation")
+        three_degree=molecule("general_tertiary_carbocation")
 
         classifications = VGroup(
             *[TextMobject(f"{name} Degree").next_to(chem,DOWN)
@@ -919,9 +925,7 @@ class EmphasizeStep2(EmphasizeStepTemplate):
 
 class Step2(Scene):
     def construct(self):
-        carbocation = ChemObject(
-            "CH_3-\\charge{90:4pt=$\\oplus$}{C}H-CH_2(-[-2]H)"
-        )
+        carbocation = molecule("secondary_carbocation")
         #
         carbocation[0][11].set_color(RED) #Hydrogen
         carbocation[0][12].set_color_by_gradient(WHITE,WHITE,WHITE,RED) #Bond
@@ -942,7 +946,7 @@ class Step2(Scene):
         # self.add(get_submobject_index_labels(carbocation[0]))
         self.play(
 
-            MoveAlongPath(nucleophile[0][2],ghost_circle),
+            MoveAlongCurve(nucleophile[0][2],ghost_circle),
         )
         self.play(
             ApplyMethod(nucleophile.next_to,carbocation[0][4],UP,dict(buff=0.3))
@@ -1072,7 +1076,7 @@ class Stretch(Transform):
 
 class LogoScene(Scene):
     def construct(self):
-        kilacoda = ChemWithName("K(-[1]I(-[::0]La(=[::90]Co(-[::-90]Da))))","KilaCoda")
+        kilacoda = ChemWithName(ChemObject("K(-[1]I(-[::0]La(=[::90]Co(-[::-90]Da))))"),"KilaCoda")
         kilacoda.name.scale(1.75)
         kilacoda.chem.scale(1.5).shift(UP*0.5)
 
@@ -0,0 +1,85 @@
+"""
+Benchmarks how `Polymer` construction scales with the number of repetitions, using
+the same repeat units as the `PolymerTest*` scenes. Each run happens in a fresh
+process so peak memory isn't polluted by the runs before it.
+
+Usage:
+    python bench_polymers.py
+    python bench_polymers.py --sizes 10 100 --units benzene --output bench.json
+"""
+
+import argparse
+import json
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+## name: (base unit, repetition indices, extra Polymer kwargs)
+UNITS = {
+    "benzene": ("Benzene", [0, 1, 3, 4, 6, 7], {}),
+    "ethenylene": ("-CH=CH", [2, 4], {}),
+    "neoprene": (
+        "-CH_2-C(-[-2]Cl)=CH-CH_2",
+        [3, 14],
+        {"_overlap_check_tolerance": 1.75},
+    ),
+}
+SIZES = [10, 100, 1000, 5000]
+
+
+def run_case(unit_name: str, num_repetitions: int) -> dict:
+    import polymers
+
+    chem_code, repetition_indices, kwargs = UNITS[unit_name]
+    if chem_code == "Benzene":
+        chem_code = polymers.Benzene
+
+    start = time.perf_counter()
+    base_unit = polymers.ChemObject(chem_code)
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    p = polymers.Polymer(
+        base_unit, repetition_indices, num_repetitions=num_repetitions, **kwargs
+    )
+    layout_time = time.perf_counter() - start
+
+    return {
+        "unit": unit_name,
+        "num_repetitions": num_repetitions,
+        "units_placed": len(p),
+        "compile_seconds": compile_time,
+        "layout_seconds": layout_time,
+        "collision_checks": p.layout.collision_checks,
+        ## ru_maxrss is in kilobytes on Linux.
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--units", nargs="+", choices=UNITS, default=list(UNITS))
+    parser.add_argument("--output", default="polymer_bench.json")
+    args = parser.parse_args()
+
+    results = []
+    for unit_name in args.units:
+        for size in args.sizes:
+            with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as pool:
+                result = pool.submit(run_case, unit_name, size).result()
+            print(
+                f"{unit_name:>12} x {size:<6} "
+                f"{result['layout_seconds']:9.3f}s "
+                f"{result['collision_checks']:>10} checks "
+                f"{result['peak_rss_mb']:8.1f} MB"
+            )
+            results.append(result)
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+Snapshots of a scene partway through, so scenes that carry on from another one don't
+have to play (and render) the whole thing again just to get to where it left off.
+
+The parent marks the point with `self.checkpoint("name", some_mob=some_mob, ...)`,
+which pickles everything on screen plus the named attributes. The child calls
+`self.resume_from(Parent, "name")` instead of `super().construct()`, which puts the
+mobjects back on screen and sets the attributes on itself. If there's no snapshot
+yet, or the parent's source (or anything it imports) has changed since it was
+taken, the parent's construct is run with every animation skipped, which takes one
+along the way.
+"""
+
+import ast
+import hashlib
+import inspect
+import os
+import pickle
+from importlib import metadata
+from pathlib import Path
+
+from manim import config, logger
+
+
+def get_checkpoint_dir() -> Path:
+    return Path(config.media_dir) / "checkpoints"
+
+
+def get_checkpoint_file(scene_class, name: str):
+    """
+    Where `scene_class`'s checkpoint called `name` goes. Keyed by the source of the
+    file it's defined in, every local module it imports (see `get_local_imports`)
+    and the manim and chanim versions, so changing any of the classes that end up
+    pickled leaves stale snapshots behind rather than resuming from them. None if
+    the source can't be found (say, the file was run without being registered as a
+    module), in which case there's no snapshot to be trusted and the scene is
+    always replayed.
+    """
+    try:
+        scene_file = Path(inspect.getsourcefile(scene_class)).resolve()
+        local_files = get_local_imports(scene_file)
+    except (TypeError, OSError, SyntaxError):
+        return None
+
+    digest = hashlib.sha256()
+    for package in ("manim", "chanim"):
+        digest.update(get_version(package).encode())
+    try:
+        for file in sorted(local_files):
+            digest.update(file.name.encode())
+            digest.update(file.read_bytes())
+    except OSError:
+        return None
+    digest = digest.hexdigest()[:16]
+    return get_checkpoint_dir() / f"{scene_class.__name__}.{name}.{digest}.pkl"
+
+
+def get_local_imports(file: Path) -> set:
+    """
+    `file` and every module next to it that it imports (chem_cache.py, curves.py...),
+    directly or through one of the others. Read off the import statements rather
+    than `sys.modules`, so it's the same whichever process asks.
+    """
+    found = set()
+    pending = [file]
+    while pending:
+        file = pending.pop()
+        if file in found:
+            continue
+        found.add(file)
+        for node in ast.walk(ast.parse(file.read_bytes())):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and not node.level and node.module:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                module_file = file.parent / f"{name.partition('.')[0]}.py"
+                if module_file.exists():
+                    pending.append(module_file)
+    return found
+
+
+def get_version(package: str) -> str:
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return ""
+
+
+class _ReachedCheckpoint(Exception):
+    def __init__(self, state):
+        self.state = state
+
+
+class CheckpointMixin:
+    """
+    Goes in front of `Scene` (or whatever Scene subclass) in the bases.
+    """
+
+    def checkpoint(self, name: str, **attrs):
+        ## When the prefix is being replayed for a child, the snapshot still belongs
+        ## to the class whose construct is running.
+        scene_class = getattr(self, "_checkpoint_class", type(self))
+        state = {
+            "mobjects": list(self.mobjects),
+            "foreground_mobjects": list(self.foreground_mobjects),
+            "attrs": attrs,
+        }
+
+        ## One pickle for everything, so an attribute that's also on screen comes
+        ## back as the very same mobject.
+        try:
+            data = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError) as error:
+            ## Usually an updater lambda somewhere in there.
+            logger.warning(
+                f"Couldn't checkpoint {scene_class.__name__}.{name}: {error}"
+            )
+        else:
+            file = get_checkpoint_file(scene_class, name)
+            if file is not None:
+                file.parent.mkdir(parents=True, exist_ok=True)
+                temp_file = file.with_suffix(f".{os.getpid()}.tmp")
+                temp_file.write_bytes(data)
+                os.replace(temp_file, file)
+
+        ## No point in running the rest of the prefix for whoever's resuming.
+        if getattr(self, "_checkpoint_name", None) == name:
+            raise _ReachedCheckpoint(state)
+
+    def resume_from(self, scene_class, name: str) -> dict:
+        """
+        Picks up where `scene_class`'s checkpoint `name` left off, replacing whatever
+        is on screen. Returns the checkpointed attributes, which are also set on
+        `self`.
+        """
+        file = get_checkpoint_file(scene_class, name)
+        state = None
+        if file is not None:
+            try:
+                state = pickle.loads(file.read_bytes())
+            except (
+                OSError,
+                EOFError,
+                pickle.UnpicklingError,
+                ## A pickled class that's since been renamed or moved.
+                AttributeError,
+                ImportError,
+            ):
+                pass
+        if state is None:
+            state = self.replay_silently(scene_class, name)
+
+        self.clear()
+        self.add(*state["mobjects"])
+        self.add_foreground_mobjects(*state["foreground_mobjects"])
+        for attr, value in state["attrs"].items():
+            setattr(self, attr, value)
+        return state["attrs"]
+
+    def replay_silently(self, scene_class, name: str) -> dict:
+        """
+        Runs `scene_class.construct` on this scene up to its checkpoint `name`,
+        without rendering any of it, and returns the checkpointed state. None of the
+        replayed plays count: the animation numbers (what `-n` goes by), the scene
+        time and the file writer's partial movie list are put back afterwards, so
+        the rest of the scene comes out the same whether there was a snapshot or not.
+        """
+        renderer = self.renderer
+        writer = renderer.file_writer
+        ## The renderer resets skip_animations from the original status every play.
+        skipping = renderer.skip_animations, renderer._original_skipping_status
+        counters = (
+            renderer.num_plays,
+            renderer.time,
+            len(renderer.animations_hashes),
+            len(writer.partial_movie_files),
+            len(writer.sections),
+            len(writer.sections[-1].partial_movie_files),
+        )
+        ## -n is about the scene's own plays, none of these should trip it.
+        animation_range = config.from_animation_number, config.upto_animation_number
+        renderer.skip_animations = renderer._original_skipping_status = True
+        config.from_animation_number, config.upto_animation_number = 0, -1
+        self._checkpoint_class, self._checkpoint_name = scene_class, name
+        try:
+            scene_class.construct(self)
+        except _ReachedCheckpoint as reached:
+            return reached.state
+        finally:
+            renderer.skip_animations, renderer._original_skipping_status = skipping
+            config.from_animation_number, config.upto_animation_number = (
+                animation_range
+            )
+            (
+                renderer.num_plays,
+                renderer.time,
+                num_hashes,
+                num_partial_movies,
+                num_sections,
+                num_section_movies,
+            ) = counters
+            del renderer.animations_hashes[num_hashes:]
+            del writer.partial_movie_files[num_partial_movies:]
+            del writer.sections[num_sections:]
+            del writer.sections[-1].partial_movie_files[num_section_movies:]
+            del self._checkpoint_class, self._checkpoint_name
+
+        raise ValueError(
+            f"{scene_class.__name__}.construct never reached checkpoint {name!r}."
+        )
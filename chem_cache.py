@@ -0,0 +1,649 @@
+"""
+On-disk cache of compiled chemfig structures.
+
+Every `ChemObject` goes through a LaTeX run, a dvisvgm run and SVG parsing, even
+though the scenes keep building the same handful of molecules over and over.
+`CachedChemObject` stores what all of that produces (the points, submobject
+hierarchy and style of the finished mobject) keyed by the chemfig code and
+everything else that goes into the TeX document, and rebuilds the mobject from it
+on later runs, memory mapping the points straight off disk. Entries are written
+atomically, so any number of render processes can share the cache, and the oldest
+entries are evicted once it grows past `CACHE_SIZE_LIMIT`.
+"""
+
+import ast
+import hashlib
+import inspect
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+from chanim import ChemObject, ComplexChemIon
+from chanim.templates import ChemTemplate
+from chem_index import build_chem_index
+from curves import get_subpaths
+from manim import DEFAULT_FONT_SIZE, MathTex, VMobject, config, logger
+
+## Bump whenever the layout of a cache entry changes.
+CACHE_VERSION = 4
+CACHE_SIZE_LIMIT = 256 * 1024**2
+LATEX_COMPILERS = ("latex", "pdflatex", "luatex", "lualatex")
+## What `find_chemfig_calls` looks for, and which of their keyword arguments don't
+## make it into the TeX.
+CHEMFIG_FUNCTIONS = {
+    "ChemObject": (),
+    "CachedChemObject": (),
+    "molecule": (),
+    "ComplexChemIon": (),
+    "ChemWithName": ("name_direction", "label_constructor", "buff"),
+}
+## The ones whose structures end up in the cache rather than just having their TeX
+## compiled.
+CACHED_CHEMFIG_FUNCTIONS = ("ChemObject", "CachedChemObject", "molecule")
+## Structures build_chem_index couldn't make sense of that have been warned about,
+## so scenes building the same one over and over only hear about it once.
+_unindexed_chem_codes = set()
+
+
+def get_chem_cache_dir() -> Path:
+    return Path(config.media_dir) / "chem_cache"
+
+
+def get_chem_cache_key(chem_code: str, **kwargs) -> str:
+    """
+    Hash of the chemfig code, the keyword arguments it's compiled with and the TeX
+    template (preamble included) that `ChemObject` wraps it in.
+    """
+    ## Leaving split_charges=False out keeps the keys the same as before it existed.
+    if not kwargs.get("split_charges", True):
+        del kwargs["split_charges"]
+    hasher = hashlib.sha256()
+    for part in (
+        str(CACHE_VERSION),
+        chem_code,
+        repr(sorted(kwargs.items())),
+        ChemTemplate().body,
+    ):
+        hasher.update(part.encode())
+        hasher.update(b"\0")
+    return hasher.hexdigest()[:32]
+
+
+def flatten_family(mob: VMobject) -> dict:
+    """
+    Packs `mob` and all of its descendants, in depth first order, into a few flat
+    arrays: everyone's points back to back, where each one's points start, who
+    their parent is and how they're styled.
+    """
+    family = []
+    parents = []
+
+    def visit(node, parent):
+        family.append(node)
+        parents.append(parent)
+        index = len(family) - 1
+        for child in node.submobjects:
+            visit(child, index)
+
+    visit(mob, -1)
+
+    return {
+        "points": np.concatenate([node.points.reshape(-1, 3) for node in family]),
+        "point_bounds": np.cumsum([0] + [len(node.points) for node in family]),
+        "parents": np.array(parents),
+        "fill_rgbas": np.array([node.fill_rgbas[0] for node in family]),
+        "stroke_rgbas": np.array([node.stroke_rgbas[0] for node in family]),
+        "stroke_widths": np.array([node.stroke_width for node in family]),
+    }
+
+
+def unflatten_family(root: VMobject, arrays: dict) -> VMobject:
+    """
+    Rebuilds the hierarchy packed by `flatten_family` underneath `root`, which
+    takes the place of the original top level mobject.
+    """
+    bounds = arrays["point_bounds"]
+    family = []
+    for i, parent in enumerate(arrays["parents"]):
+        node = root if i == 0 else VMobject()
+        node.points = np.asarray(arrays["points"][bounds[i] : bounds[i + 1]])
+        node.fill_rgbas = np.array(arrays["fill_rgbas"][i : i + 1])
+        node.stroke_rgbas = np.array(arrays["stroke_rgbas"][i : i + 1])
+        node.stroke_width = float(arrays["stroke_widths"][i])
+        if parent >= 0:
+            family[parent].add(node)
+        family.append(node)
+    return root
+
+
+def flatten_chem_index(chem_code: str, glyphs: list) -> dict:
+    """
+    Runs `build_chem_index` and packs what it finds into arrays that can go in a
+    cache entry: every atom's label and glyph range in written order, every bond's
+    glyph range, and why it failed if it did.
+    """
+    try:
+        atoms, bonds = build_chem_index(chem_code, glyphs)
+        error = ""
+    except ValueError as e:
+        atoms, bonds, error = {}, [], str(e)
+    labelled_ranges = [
+        (label, glyph_range)
+        for label, ranges in atoms.items()
+        for glyph_range in ranges
+    ]
+    return {
+        "atom_labels": np.array([label for label, _ in labelled_ranges], dtype=str),
+        "atom_ranges": np.array(
+            [glyph_range for _, glyph_range in labelled_ranges], dtype=int
+        ).reshape(-1, 2),
+        "bond_ranges": np.array(bonds, dtype=int).reshape(-1, 2),
+        "chem_index_error": np.array(error),
+    }
+
+
+def unflatten_chem_index(arrays: dict):
+    """
+    The `(atoms, bonds, error)` packed by `flatten_chem_index`, `error` being None
+    if the index was built fine.
+    """
+    atoms = {}
+    for label, (start, stop) in zip(arrays["atom_labels"], arrays["atom_ranges"]):
+        atoms.setdefault(str(label), []).append((int(start), int(stop)))
+    bonds = [(int(start), int(stop)) for start, stop in arrays["bond_ranges"]]
+    return atoms, bonds, str(arrays["chem_index_error"]) or None
+
+
+def split_charge_glyphs(mob: VMobject, max_dot_size=0.1) -> list:
+    """
+    chemfig's `\\charge` draws all the dots of a charge as one glyph. This gives
+    every glyph of `mob` that's nothing but a few small dots one submobject per dot,
+    leaving the glyph itself without points of its own, so `chem[0][i]` still finds
+    the glyph and `chem[0][i][j]` is its j-th electron. Returns the glyphs it split.
+    """
+    split = []
+    for glyph in mob.family_members_with_points():
+        subpaths = get_subpaths(glyph.points)
+        if len(subpaths) < 2 or any(
+            np.ptp(subpath.reshape(-1, 3), axis=0).max() > max_dot_size
+            for subpath in subpaths
+        ):
+            continue
+
+        dots = [
+            VMobject().set_points(subpath.reshape(-1, 3)).match_style(glyph)
+            for subpath in subpaths
+        ]
+        glyph.points = np.zeros((0, 3))
+        glyph.add(*dots)
+        split.append(glyph)
+    return split
+
+
+def make_chem_template(tex_template=ChemTemplate, **kwargs) -> ChemTemplate:
+    """
+    The TeX template `ChemObject` makes for itself out of these keyword arguments.
+    """
+    chemfig_options = inspect.signature(ChemTemplate.set_chemfig).parameters
+    template = tex_template()
+    template.set_chemfig(
+        **{name: value for name, value in kwargs.items() if name in chemfig_options}
+    )
+    return template
+
+
+def get_chem_cache_entry(chem_code: str, **kwargs) -> Path:
+    """
+    Where the cache entry for a structure lives, minus the suffix: `.npy` holds
+    everyone's points in one array, `.npz` the (small) hierarchy and style tables.
+    """
+    return get_chem_cache_dir() / get_chem_cache_key(chem_code, **kwargs)
+
+
+def load_cache_entry(entry: Path):
+    """
+    The arrays stored for `entry`, or None if there's no (readable) entry. Points are
+    memory mapped copy-on-write rather than read in, so a warm load doesn't copy
+    them at all until something actually moves the mobject. Reading an entry counts
+    as using it as far as eviction is concerned.
+    """
+    tables_file = entry.with_suffix(".npz")
+    try:
+        with np.load(tables_file) as tables:
+            arrays = {name: tables[name] for name in tables.files}
+        ## "c" rather than "r", since manim shifts points in place.
+        arrays["points"] = np.load(entry.with_suffix(".npy"), mmap_mode="c")
+        os.utime(tables_file)
+    except (OSError, ValueError, KeyError):
+        ## Missing, half written by an older version, or evicted under our feet.
+        return None
+    return arrays
+
+
+def save_cache_entry(entry: Path, arrays: dict, size_limit=CACHE_SIZE_LIMIT):
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    arrays = dict(arrays)
+    points = arrays.pop("points")
+
+    ## Write somewhere private first so nobody else ever sees half a file. The
+    ## tables go in last, since that's what readers look for.
+    temp_file = entry.with_suffix(f".{os.getpid()}.tmp")
+    with open(temp_file, "wb") as f:
+        np.save(f, points)
+    os.replace(temp_file, entry.with_suffix(".npy"))
+    with open(temp_file, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(temp_file, entry.with_suffix(".npz"))
+
+    evict_cache_entries(entry.parent, size_limit)
+
+
+def evict_cache_entries(cache_dir: Path, size_limit=CACHE_SIZE_LIMIT):
+    """
+    Deletes the least recently used entries until the cache fits in `size_limit`
+    bytes.
+    """
+    entries = []
+    for tables_file in cache_dir.glob("*.npz"):
+        points_file = tables_file.with_suffix(".npy")
+        try:
+            last_used = tables_file.stat().st_mtime
+            size = tables_file.stat().st_size + points_file.stat().st_size
+        except FileNotFoundError:
+            continue
+        entries.append((last_used, size, tables_file, points_file))
+
+    total_size = sum(size for _, size, _, _ in entries)
+    for _, size, tables_file, points_file in sorted(entries):
+        if total_size <= size_limit:
+            break
+        ## Tables first, so nobody picks up an entry that's missing its points.
+        for file in (tables_file, points_file):
+            try:
+                file.unlink()
+            except FileNotFoundError:
+                ## Another process got to it first.
+                pass
+        total_size -= size
+
+
+class CachedChemObject(ChemObject):
+    """
+    Drop-in `ChemObject` that only compiles its chemfig code the first time it's
+    seen, anywhere. Later ones are rebuilt straight from the cache, with the same
+    submobject structure, so indexing like `chem[0][13]` keeps working, and the
+    same attributes (`font_size`, `tex_strings`, `template`...). The one difference
+    is that the submobjects of a rebuilt one are all plain `VMobject`s.
+
+    With `split_charges=True`, the dots of every `\\charge` come out as separate
+    submobjects of their glyph (see `split_charge_glyphs`), cached along with the
+    rest of it.
+
+    Atoms and bonds can also be picked out by name, see chem_index.py:
+
+        chem.atom("N", 1)  ## the second N written in the code
+        chem.bond(3)  ## the fourth bond written in the code
+    """
+
+    def __init__(self, chem_code: str, split_charges=False, **kwargs):
+        cache_entry = get_chem_cache_entry(
+            chem_code, split_charges=split_charges, **kwargs
+        )
+        arrays = load_cache_entry(cache_entry)
+
+        if arrays is None:
+            super().__init__(chem_code, **kwargs)
+            if split_charges:
+                split_charge_glyphs(self)
+            arrays = {
+                **flatten_family(self),
+                **flatten_chem_index(chem_code, self[0].submobjects),
+                "initial_height": np.array(self.initial_height),
+            }
+            save_cache_entry(cache_entry, arrays)
+        else:
+            VMobject.__init__(self)
+            unflatten_family(self, arrays)
+            self.restore_tex_attributes(
+                chem_code, float(arrays["initial_height"]), **kwargs
+            )
+
+        self.chem_code = chem_code
+        self.atom_index, self.bond_index, error = unflatten_chem_index(arrays)
+        if error is not None and chem_code not in _unindexed_chem_codes:
+            _unindexed_chem_codes.add(chem_code)
+            logger.warning(f"{error} atom() and bond() won't work on it.")
+
+    def restore_tex_attributes(self, chem_code: str, initial_height: float, **kwargs):
+        """
+        Sets what `ChemObject`, `MathTex` and `SingleStringMathTex` would have set in
+        their `__init__`s, which a cache hit skips.
+        """
+        self.template = make_chem_template(**kwargs)
+        self.tex_template = self.template
+
+        self.arg_separator = kwargs.get("arg_separator", " ")
+        self.tex_to_color_map = dict(kwargs.get("tex_to_color_map") or {})
+        self.substrings_to_isolate = [
+            *(kwargs.get("substrings_to_isolate") or []),
+            *self.tex_to_color_map,
+        ]
+        self.tex_environment = kwargs.get("tex_environment", "align*")
+        self.brace_notation_split_occurred = False
+        self.tex_string = "\\chemfig{%s}" % chem_code
+        self.tex_strings = [self.tex_string]
+        self.matched_strings_and_ids = []
+
+        self._font_size = kwargs.get("font_size", DEFAULT_FONT_SIZE)
+        self.organize_left_to_right = kwargs.get("organize_left_to_right", False)
+        self.initial_height = initial_height
+
+    def atom(self, label: str, k: int = 0) -> VMobject:
+        """
+        The glyphs of the `k`th atom (counting from 0, in the order they're written)
+        labelled `label`, like `"CH2"` for `\\charge{90:4pt=$+$}{C}H_2`.
+        """
+        start, stop = self.atom_index[label][k]
+        return self[0][start:stop]
+
+    def bond(self, i: int) -> VMobject:
+        """
+        The glyphs of the `i`th bond (counting from 0, in the order they're written).
+        """
+        start, stop = self.bond_index[i]
+        return self[0][start:stop]
+
+
+## Batch compilation ##
+def find_chemfig_calls(scene_file) -> list:
+    """
+    Statically scans `scene_file` for calls that build a chemfig structure and
+    returns the `(function_name, chem_code, kwargs)` of every one whose arguments
+    are literals, or module level string constants like `LUMINOL`. That's
+    `ChemObject(...)`, `CachedChemObject(...)`, `ComplexChemIon(...)`,
+    `ChemWithName("<code>", ...)` and `molecule("<name>")` (looked up in
+    molecules.py). Doesn't import (let alone run) the file.
+    """
+    from molecules import MOLECULES
+
+    tree = ast.parse(Path(scene_file).read_text(encoding="utf-8"))
+
+    constants = {
+        target.id: node.value.value
+        for node in tree.body
+        if isinstance(node, ast.Assign)
+        and isinstance(node.value, ast.Constant)
+        and isinstance(node.value.value, str)
+        for target in node.targets
+        if isinstance(target, ast.Name)
+    }
+
+    found = {}
+    for node in ast.walk(tree):
+        if not (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id in CHEMFIG_FUNCTIONS
+            and node.args
+        ):
+            continue
+
+        arg = node.args[0]
+        if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+            chem_code = arg.value
+        elif isinstance(arg, ast.Name) and arg.id in constants:
+            chem_code = constants[arg.id]
+        else:
+            continue
+        if node.func.id == "molecule":
+            if chem_code not in MOLECULES:
+                continue
+            chem_code = MOLECULES[chem_code]
+
+        keywords = [
+            kw
+            for kw in node.keywords
+            if kw.arg not in CHEMFIG_FUNCTIONS[node.func.id]
+        ]
+        try:
+            kwargs = {kw.arg: ast.literal_eval(kw.value) for kw in keywords}
+        except ValueError:
+            continue
+        if None in kwargs:  ## **kwargs
+            continue
+
+        found[(node.func.id, chem_code, repr(sorted(kwargs.items())))] = (
+            node.func.id,
+            chem_code,
+            kwargs,
+        )
+    return list(found.values())
+
+
+def find_chemfig_codes(scene_file) -> list:
+    """
+    The `(chem_code, kwargs)` of every structure `scene_file` builds through the
+    cache, i.e. with `ChemObject`, `CachedChemObject` or `molecule`.
+    """
+    return [
+        (chem_code, kwargs)
+        for function_name, chem_code, kwargs in find_chemfig_calls(scene_file)
+        if function_name in CACHED_CHEMFIG_FUNCTIONS
+    ]
+
+
+def get_tex_job(chem_code: str, mobject_class=ChemObject, **kwargs) -> tuple:
+    """
+    The `(expression, environment, tex_template)` a `mobject_class` (`ChemObject`
+    or `ComplexChemIon`) would hand to manim's `tex_to_svg_file`, without building
+    one. The expression goes through the same `MathTex` methods the constructor
+    runs it through, called on a bare instance, so the batch ends up with the same
+    files (and hashes) manim looks for. None if the installed manim doesn't have
+    those methods, in which case it's left for manim to compile the usual way.
+    """
+    ## Splitting happens after the SVG's imported, it doesn't change the TeX.
+    kwargs.pop("split_charges", None)
+    if mobject_class is ComplexChemIon:
+        tex_string = "\\chemleft[\\chemfig{%s}\\chemright]^{%s}" % (
+            chem_code,
+            kwargs.get("charge", ""),
+        )
+        tex_template = kwargs.get("tex_template") or ChemTemplate()
+    else:
+        tex_string = "\\chemfig{%s}" % chem_code
+        tex_template = make_chem_template(**kwargs)
+
+    ## Just enough of what MathTex.__init__ sets for its string handling to work.
+    tex = MathTex.__new__(MathTex)
+    tex.arg_separator = kwargs.get("arg_separator", " ")
+    tex.brace_notation_split_occurred = False
+    tex.matched_strings_and_ids = []
+    substrings_to_isolate = [
+        *(kwargs.get("substrings_to_isolate") or []),
+        *(kwargs.get("tex_to_color_map") or {}),
+    ]
+    try:
+        joined_string = tex._join_tex_strings_with_unique_deliminters(
+            tex._prepare_tex_strings([tex_string]), substrings_to_isolate
+        )
+        expression = tex._get_modified_expression(joined_string)
+    except AttributeError as error:
+        logger.debug(f"Not batch compiling {chem_code!r}: {error}")
+        return None
+    return expression, kwargs.get("tex_environment", "align*"), tex_template
+
+
+def batch_compile_tex_jobs(jobs: list):
+    """
+    Compiles every `(expression, environment, tex_template)` job whose SVG manim
+    doesn't already have with one LaTeX run per distinct preamble, one page per job,
+    then splits the pages into the SVG files manim expects. Anything that can't be
+    batched is left alone for manim to compile the usual way.
+    """
+    from manim.utils.tex_file_writing import generate_tex_file
+
+    groups = {}
+    for expression, environment, template in jobs:
+        svg_file = generate_tex_file(expression, environment, template).with_suffix(
+            ".svg"
+        )
+        if svg_file.exists():
+            continue
+
+        tex_code = (
+            template.get_texcode_for_expression_in_env(expression, environment)
+            if environment is not None
+            else template.get_texcode_for_expression(expression)
+        )
+        preamble, _, rest = tex_code.partition("\\begin{document}")
+        body = rest.rpartition("\\end{document}")[0]
+        compilers = template.tex_compiler
+        ## Newer manim versions take a list of compilers to run one after another.
+        compilers = (compilers,) if isinstance(compilers, str) else tuple(compilers)
+        key = (preamble, compilers, template.output_format)
+        groups.setdefault(key, []).append((body, svg_file))
+
+    for (preamble, compilers, output_format), pages in groups.items():
+        compile_tex_pages(preamble, compilers, output_format, pages)
+
+
+def compile_tex_pages(preamble: str, compilers: tuple, output_format: str, pages: list):
+    if any(compiler not in LATEX_COMPILERS for compiler in compilers) or (
+        output_format not in (".dvi", ".pdf")
+    ):
+        logger.debug(
+            f"Not batch compiling {len(pages)} chemfig structures with "
+            f"{' then '.join(compilers)} to {output_format}."
+        )
+        return
+
+    ## `standalone`'s multi option puts every chembatchpage on its own, still
+    ## cropped, page.
+    batch_preamble, num_subs = re.subn(
+        r"\\documentclass(?:\[([^\]]*)\])?\{standalone\}",
+        lambda match: "\\documentclass[%s]{standalone}"
+        % ",".join(filter(None, [match[1], "multi=chembatchpage"])),
+        preamble,
+        count=1,
+    )
+    if not num_subs:
+        logger.debug(
+            f"Not batch compiling {len(pages)} chemfig structures, their template "
+            "isn't a standalone document."
+        )
+        return
+
+    document = "".join(
+        [
+            batch_preamble,
+            "\\newenvironment{chembatchpage}{}{}\n\\begin{document}\n",
+            *[
+                f"\\begin{{chembatchpage}}{body}\\end{{chembatchpage}}\n"
+                for body, _ in pages
+            ],
+            "\\end{document}\n",
+        ]
+    )
+
+    tex_dir = config.get_dir("tex_dir")
+    tex_dir.mkdir(parents=True, exist_ok=True)
+    name = f"chembatch_{hashlib.sha256(document.encode()).hexdigest()[:16]}"
+    tex_file = tex_dir / f"{name}.tex"
+    tex_file.write_text(document, encoding="utf-8")
+
+    for compiler in compilers:
+        latex_run = subprocess.run(
+            [
+                compiler,
+                "-interaction=batchmode",
+                f"-output-format={output_format[1:]}",
+                "-halt-on-error",
+                f"-output-directory={tex_dir.as_posix()}",
+                tex_file.as_posix(),
+            ],
+            stdout=subprocess.DEVNULL,
+        )
+        if latex_run.returncode != 0:
+            logger.warning(
+                f"Batch compiling {len(pages)} chemfig structures failed, see "
+                f"{tex_file.with_suffix('.log')}. They'll be compiled one by one "
+                "instead."
+            )
+            return
+
+    subprocess.run(
+        [
+            "dvisvgm",
+            *(["--pdf"] if output_format == ".pdf" else []),
+            "--page=1-",
+            "--no-fonts",
+            "--verbosity=0",
+            f"--output={(tex_dir / name).as_posix()}-%p.svg",
+            tex_file.with_suffix(output_format).as_posix(),
+        ],
+        stdout=subprocess.DEVNULL,
+    )
+
+    page_files = sorted(
+        tex_dir.glob(f"{name}-*.svg"),
+        key=lambda file: int(file.stem.rpartition("-")[2]),
+    )
+    if len(page_files) != len(pages):
+        logger.warning(
+            f"Expected {len(pages)} pages out of {tex_file}, got {len(page_files)}. "
+            "Compiling them one by one instead."
+        )
+        for file in page_files:
+            file.unlink()
+        return
+
+    for page_file, (_, svg_file) in zip(page_files, pages):
+        os.replace(page_file, svg_file)
+
+
+def precompile_chemfig_codes(codes: Iterable, uncached_jobs=()):
+    """
+    Makes sure every `(chem_code, kwargs)` pair in `codes` is in the cache, compiling
+    all the missing ones in one go, along with any extra `(expression, environment,
+    tex_template)` jobs in `uncached_jobs`.
+    """
+    missing = [
+        (chem_code, kwargs)
+        for chem_code, kwargs in codes
+        if not get_chem_cache_entry(chem_code, **kwargs).with_suffix(".npz").exists()
+    ]
+    jobs = [get_tex_job(chem_code, **kwargs) for chem_code, kwargs in missing]
+    jobs += uncached_jobs
+    batch_compile_tex_jobs([job for job in jobs if job is not None])
+    for chem_code, kwargs in missing:
+        CachedChemObject(chem_code, **kwargs)
+
+
+def precompile_scene_file(scene_file):
+    """
+    Makes sure every chemfig structure `scene_file` builds is in the cache, and
+    that the TeX of the ones built some other way (`ComplexChemIon`, `ChemWithName`
+    given a string) is compiled.
+    """
+    codes, uncached_jobs = [], []
+    for function_name, chem_code, kwargs in find_chemfig_calls(scene_file):
+        if function_name in CACHED_CHEMFIG_FUNCTIONS:
+            codes.append((chem_code, kwargs))
+        else:
+            mobject_class = (
+                ComplexChemIon if function_name == "ComplexChemIon" else ChemObject
+            )
+            uncached_jobs.append(get_tex_job(chem_code, mobject_class, **kwargs))
+    precompile_chemfig_codes(
+        codes, [job for job in uncached_jobs if job is not None]
+    )
+
+
+if __name__ == "__main__":
+    ## python chem_cache.py luminol.py pinacol.py ...
+    for scene_file in sys.argv[1:]:
+        precompile_scene_file(scene_file)
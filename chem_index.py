@@ -0,0 +1,256 @@
+"""
+Finds which glyphs of a compiled chemfig structure belong to which atom and bond, so
+scenes can ask for `chem.atom("N", 1)` instead of working out `chem[0][13]` from an
+`index_labels` render.
+
+dvisvgm hands the glyphs back in the order chemfig draws them: the atoms in the
+order they're written, each bond right after the atom it leads to (or straight away
+if it leads to an empty one, like a ring vertex). Bonds are drawn as plain straight
+strokes, which no letter or charge symbol is, so walking the glyphs alongside the
+tokenized chemfig code is enough to tell where each atom stops and each bond starts.
+The one place that doesn't work is two atoms drawn back to back (`CH_3-CH(...)` draws
+CH before the bond leading to it), where the first is assumed to be one glyph per
+character and charge.
+"""
+
+import re
+
+import numpy as np
+
+## Bond glyph counts, for the kinds drawn as one straight line per stroke.
+LINE_BOND_STROKES = {"-": 1, "=": 2, "~": 3}
+## Commands that wrap an atom, and which of their brace arguments is the atom.
+ATOM_WRAPPERS = {"charge": 1, "Charge": 1, "chemabove": 0, "chembelow": 0}
+
+
+def read_group(code: str, i: int, opening="{", closing="}") -> int:
+    """
+    Index just past the balanced group opening at `code[i]`.
+    """
+    depth = 0
+    for j in range(i, len(code)):
+        if code[j] == opening and (j == 0 or code[j - 1] != "\\"):
+            depth += 1
+        elif code[j] == closing and code[j - 1] != "\\":
+            depth -= 1
+            if not depth:
+                return j + 1
+    return len(code)
+
+
+def read_atom(code: str, i: int) -> int:
+    """
+    Index just past the atom starting at `code[i]`: everything up to the next bond,
+    branch or ring outside of braces and math.
+    """
+    while i < len(code):
+        char = code[i]
+        if char == "\\":
+            i += 2
+        elif char == "{":
+            i = read_group(code, i)
+        elif char == "$":
+            closing = code.find("$", i + 1)
+            i = len(code) if closing == -1 else closing + 1
+        elif char in "-=~<>()*?@" or char.isspace():
+            break
+        else:
+            i += 1
+    return i
+
+
+def tokenize_chemfig(chem_code: str) -> list:
+    """
+    The atoms, bonds and branches of `chem_code`, in the order they're written, as
+    `("atom", raw_text)`, `("bond", kind)` and `("branch", "(" or ")")`. Rings
+    show up as their bonds and branches, everything that draws nothing (angles,
+    node names, ring sizes) is dropped.
+    """
+    tokens = []
+    i = 0
+    while i < len(chem_code):
+        char = chem_code[i]
+        if char.isspace():
+            i += 1
+        elif char in "()":
+            tokens.append(("branch", char))
+            i += 1
+        elif char == "*":
+            ## *6( or **6(, the ( is the ring's branch.
+            i += 1
+            while i < len(chem_code) and (
+                chem_code[i] == "*" or chem_code[i].isdigit()
+            ):
+                i += 1
+        elif char == "@":
+            i = read_group(chem_code, i + 1)
+        elif char == "[":
+            ## Default angle at the very start of the code.
+            i = read_group(chem_code, i, "[", "]")
+        elif char in "-=~<>?":
+            kind = char
+            i += 1
+            if char in "<>" and i < len(chem_code) and chem_code[i] in ":|":
+                kind += chem_code[i]
+                i += 1
+            if i < len(chem_code) and chem_code[i] == "[":
+                i = read_group(chem_code, i, "[", "]")
+            tokens.append(("bond", kind))
+        else:
+            end = read_atom(chem_code, i)
+            tokens.append(("atom", chem_code[i:end]))
+            i = end
+    return tokens
+
+
+def clean_atom_label(raw: str) -> str:
+    """
+    What an atom's called for `atom()` lookups: its text with subscripts flattened,
+    charges dropped and wrapper commands unwrapped, so `\\charge{90:4pt=$+$}{C}H_2`
+    is `CH2`.
+    """
+    label = []
+    i = 0
+    while i < len(raw):
+        char = raw[i]
+        if char == "\\":
+            match = re.match(r"\\([A-Za-z]+)", raw[i:])
+            if not match:
+                i += 2
+                continue
+            i += len(match[0])
+            arguments = []
+            while i < len(raw) and raw[i] in "{[":
+                end = read_group(raw, i, raw[i], "}" if raw[i] == "{" else "]")
+                if raw[i] == "{":
+                    arguments.append(raw[i + 1 : end - 1])
+                i = end
+            if match[1] in ATOM_WRAPPERS and len(arguments) > ATOM_WRAPPERS[match[1]]:
+                label.append(clean_atom_label(arguments[ATOM_WRAPPERS[match[1]]]))
+        elif char == "$":
+            closing = raw.find("$", i + 1)
+            i = len(raw) if closing == -1 else closing + 1
+        else:
+            if char.isalnum() or char == "'":
+                label.append(char)
+            i += 1
+    return "".join(label)
+
+
+def split_top_level(text: str, separator=",") -> list:
+    """
+    `text.split(separator)`, except inside braces and brackets.
+    """
+    parts, depth, start = [], 0, 0
+    for i, char in enumerate(text):
+        if char in "{[":
+            depth += 1
+        elif char in "}]":
+            depth -= 1
+        elif char == separator and not depth:
+            parts.append(text[start:i])
+            start = i + 1
+    return parts + [text[start:]]
+
+
+def count_atom_glyphs(raw: str) -> int:
+    """
+    How many glyphs an atom should come out as: one per character of its label,
+    plus one per charge (a `$\\oplus$`, a `\\:` pair of dots...) put on it.
+    """
+    count = len(clean_atom_label(raw))
+    for match in re.finditer(r"\\[cC]harge\{", raw):
+        start = match.end() - 1
+        charges = raw[start + 1 : read_group(raw, start) - 1]
+        if charges.startswith("["):
+            charges = charges[read_group(charges, 0, "[", "]") :]
+        count += len([charge for charge in split_top_level(charges) if charge])
+    return count
+
+
+def is_line_glyph(glyph, tolerance=1e-3) -> bool:
+    """
+    Whether all of `glyph`'s points lie on one straight line, going by how small the
+    second singular value of the centered points is next to the first.
+    """
+    points = glyph.get_all_points()
+    if len(points) < 2:
+        return False
+    singular_values = np.linalg.svd(points - points.mean(axis=0), compute_uv=False)
+    return 0 < singular_values[0] and singular_values[1] <= (
+        tolerance * singular_values[0]
+    )
+
+
+def get_drawing_order(tokens: list) -> list:
+    """
+    The atoms and bonds of `tokens` (as indices into it) in the order chemfig draws
+    them: each bond comes right after the atom it leads to.
+    """
+    order = []
+    i = 0
+    while i < len(tokens):
+        kind, text = tokens[i]
+        if kind == "bond" and i + 1 < len(tokens) and tokens[i + 1][0] == "atom":
+            order += [i + 1, i]
+            i += 2
+            continue
+        if kind != "branch":
+            order.append(i)
+        i += 1
+    return order
+
+
+def build_chem_index(chem_code: str, glyphs: list):
+    """
+    Matches `glyphs` (a compiled `chem_code`'s `chem[0]`) up with its atoms and
+    bonds. Returns `(atoms, bonds)`: a dict from each atom label to the
+    `(start, stop)` glyph ranges of the atoms with that label, in the order they're
+    written, and the `(start, stop)` range of every bond, also in written order.
+    """
+    tokens = tokenize_chemfig(chem_code)
+    line_glyphs = [is_line_glyph(glyph) for glyph in glyphs]
+    bond_numbers = {}
+    for i, (kind, _) in enumerate(tokens):
+        if kind == "bond":
+            bond_numbers[i] = len(bond_numbers)
+
+    atoms = {}
+    bonds = [None] * len(bond_numbers)
+    order = get_drawing_order(tokens)
+    position = 0
+    for n, i in enumerate(order):
+        kind, text = tokens[i]
+        start = position
+        if kind == "atom":
+            if n + 1 < len(order) and tokens[order[n + 1]][0] == "atom":
+                ## Nothing drawn in between to tell where one stops, so go by how
+                ## many glyphs it ought to have.
+                position = min(position + count_atom_glyphs(text), len(glyphs))
+            else:
+                ## Otherwise, it's everything up to the next straight stroke.
+                while position < len(glyphs) and not line_glyphs[position]:
+                    position += 1
+            atoms.setdefault(clean_atom_label(text), []).append((start, position))
+        elif text in LINE_BOND_STROKES:
+            strokes = LINE_BOND_STROKES[text]
+            while position < len(glyphs) and line_glyphs[position] and strokes:
+                position += 1
+                strokes -= 1
+            bonds[bond_numbers[i]] = (start, position)
+        elif text in (">:", "<:"):
+            ## Hashed wedges are a run of short strokes.
+            while position < len(glyphs) and line_glyphs[position]:
+                position += 1
+            bonds[bond_numbers[i]] = (start, position)
+        else:
+            ## Solid wedges, and anything else, are taken to be a single glyph.
+            position = min(position + 1, len(glyphs))
+            bonds[bond_numbers[i]] = (start, position)
+
+    if position != len(glyphs):
+        raise ValueError(
+            f"Matched {position} of {len(glyphs)} glyphs of {chem_code!r} to atoms "
+            "and bonds."
+        )
+    return atoms, bonds
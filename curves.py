@@ -0,0 +1,185 @@
+"""
+Helpers for working with a VMobject's cubic Bézier curves directly, rather than by
+sampling them one `point_from_proportion` at a time.
+
+Kept out of the scene files so they can be imported without dragging a bunch of
+scenes along with them.
+"""
+
+import numpy as np
+from manim import MoveAlongPath, VMobject
+
+
+def get_bezier_curves(vmob: VMobject) -> np.ndarray:
+    """
+    Every cubic Bézier curve making up `vmob` and its family, as a (k, 4, 3) array of
+    control points.
+    """
+    curves = [
+        mob.points[: len(mob.points) - len(mob.points) % 4].reshape(-1, 4, 3)
+        for mob in vmob.family_members_with_points()
+    ]
+    return np.concatenate(curves) if curves else np.zeros((0, 4, 3))
+
+
+def get_subpaths(points: np.ndarray) -> list:
+    """
+    Splits a VMobject's points into its subpaths, as (k, 4, 3) arrays of curves. A
+    new subpath starts wherever a curve doesn't pick up where the last one ended.
+    """
+    curves = points[: len(points) - len(points) % 4].reshape(-1, 4, 3)
+    if not len(curves):
+        return []
+    breaks = np.flatnonzero(
+        np.linalg.norm(curves[1:, 0] - curves[:-1, 3], axis=1) > 1e-6
+    )
+    return np.split(curves, breaks + 1)
+
+
+def evaluate_bezier_curves(curves: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """
+    Point at parameter `t[i]` on curve `curves[i]`, for a (k, 4, 3) array of curves
+    and k parameters.
+    """
+    t = np.asarray(t, dtype=float)[:, None]
+    s = 1 - t
+    return (
+        s**3 * curves[:, 0]
+        + 3 * s**2 * t * curves[:, 1]
+        + 3 * s * t**2 * curves[:, 2]
+        + t**3 * curves[:, 3]
+    )
+
+
+def get_bezier_curve_lengths(curves: np.ndarray, sample_points=10) -> np.ndarray:
+    """
+    Approximate length of each curve in a (k, 4, 3) array, measured the same way
+    manim's `get_nth_curve_length` does: along a polyline through `sample_points`
+    evenly spaced parameters.
+    """
+    t = np.linspace(0, 1, sample_points)[:, None]
+    s = 1 - t
+    bernstein = np.hstack([s**3, 3 * s**2 * t, 3 * s * t**2, t**3])
+    samples = np.einsum("sj,kjd->ksd", bernstein, curves)
+    return np.linalg.norm(np.diff(samples, axis=1), axis=2).sum(axis=1)
+
+
+def points_from_proportions(vmob: VMobject, proportions) -> np.ndarray:
+    """
+    Batched `vmob.point_from_proportion`: the (n, 3) array of points at each of
+    `proportions` along `vmob`'s own path. The arc length table is built once for
+    all of them, and no mobjects get created along the way.
+    """
+    proportions = np.clip(np.asarray(proportions, dtype=float), 0, 1)
+    points = vmob.points
+    if not len(points):
+        raise ValueError("Can't sample a VMobject with no points.")
+    curves = points[: len(points) - len(points) % 4].reshape(-1, 4, 3)
+
+    lengths = get_bezier_curve_lengths(curves)
+    ends = np.cumsum(lengths)
+    targets = proportions * ends[-1]
+
+    ## First curve that reaches the target length, like point_from_proportion's loop.
+    indices = np.minimum(np.searchsorted(ends, targets), len(curves) - 1)
+    starts = ends[indices] - lengths[indices]
+    curve_lengths = lengths[indices]
+    residues = np.divide(
+        targets - starts,
+        curve_lengths,
+        out=np.zeros_like(targets),
+        where=curve_lengths != 0,
+    )
+
+    result = evaluate_bezier_curves(curves[indices], residues)
+    result[proportions == 1] = points[-1]
+    return result
+
+
+class MoveAlongCurve(MoveAlongPath):
+    """
+    `MoveAlongPath`, except each frame's point comes from `points_from_proportions`,
+    which measures all of the path's curves in one numpy pass rather than one
+    `get_nth_curve_length` at a time. Still done every frame, so paths with updaters
+    on them are followed just the same.
+    """
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        proportion = self.rate_func(alpha)
+        self.mobject.move_to(points_from_proportions(self.path, [proportion])[0])
+
+
+def split_bezier_curves(curves: np.ndarray):
+    """
+    Splits each curve in a (k, 4, 3) array in half with de Casteljau's algorithm,
+    returning the first and second halves as two arrays of the same shape.
+    """
+    p0, p1, p2, p3 = curves[:, 0], curves[:, 1], curves[:, 2], curves[:, 3]
+    p01, p12, p23 = (p0 + p1) / 2, (p1 + p2) / 2, (p2 + p3) / 2
+    p012, p123 = (p01 + p12) / 2, (p12 + p23) / 2
+    mid = (p012 + p123) / 2
+
+    return (
+        np.stack([p0, p01, p012, mid], axis=1),
+        np.stack([mid, p123, p23, p3], axis=1),
+    )
+
+
+def bezier_intersections(
+    vmob1: VMobject,
+    vmob2: VMobject,
+    tolerance=1e-3,
+    merge_distance=0.2,
+    max_depth=32,
+) -> list:
+    """
+    Points where the curves of `vmob1` cross those of `vmob2`.
+
+    Works by bounding box subdivision: every pair of curves whose boxes overlap gets
+    split in half and re-tested, all pairs at once, until the surviving boxes are
+    smaller than `tolerance`. Since a curve always lies inside the box of its
+    control points, no crossing can be missed. Hits closer than `merge_distance` to
+    one already found are taken to be the same intersection.
+    """
+    curves1 = get_bezier_curves(vmob1)
+    curves2 = get_bezier_curves(vmob2)
+
+    ## Start out with every pair of curves, the box test throws most of them out.
+    a = np.repeat(curves1, len(curves2), axis=0)
+    b = np.tile(curves2, (len(curves1), 1, 1))
+
+    hits = []
+    for _ in range(max_depth):
+        if not len(a):
+            break
+
+        lo_a, hi_a = a.min(axis=1), a.max(axis=1)
+        lo_b, hi_b = b.min(axis=1), b.max(axis=1)
+        overlapping = np.all(
+            (lo_a <= hi_b + tolerance) & (lo_b <= hi_a + tolerance), axis=1
+        )
+        a, b = a[overlapping], b[overlapping]
+        lo_a, hi_a, lo_b, hi_b = (
+            lo_a[overlapping],
+            hi_a[overlapping],
+            lo_b[overlapping],
+            hi_b[overlapping],
+        )
+
+        sizes = np.maximum((hi_a - lo_a).max(axis=1), (hi_b - lo_b).max(axis=1))
+        done = sizes < tolerance
+        hits.extend((lo_a[done] + hi_a[done] + lo_b[done] + hi_b[done]) / 4)
+
+        a, b = a[~done], b[~done]
+        a_first, a_second = split_bezier_curves(a)
+        b_first, b_second = split_bezier_curves(b)
+        a = np.concatenate([a_first, a_first, a_second, a_second])
+        b = np.concatenate([b_first, b_second, b_first, b_second])
+
+    intersections = []
+    for point in hits:
+        if all(
+            np.linalg.norm(point - other) > merge_distance for other in intersections
+        ):
+            intersections.append(point)
+    return intersections
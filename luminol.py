@@ -1,9 +1,13 @@
 from chanim import *
+from chem_cache import CachedChemObject as ChemObject
+from curves import MoveAlongCurve
+from checkpoints import CheckpointMixin
+from molecules import molecule
+from rendering import enable_shared_render_cache
 from pathlib import Path
 
-LUMINOL = "*6(-=*6(-(=O)-N(-H)-N(-H)-(=O)--)-=(-NH_2)-=)"
-DIANION_1 = "*6(-=*6(-(=O)-\\charge{45:2pt=$\\scriptstyle-$}{N}-\\charge{45:2pt=$\\scriptstyle-$}{N}-(=O)--)-=(-NH_2)-=)"
-O2 = "O(=[-2]O)"
+enable_shared_render_cache()
+
 endoperoxide = None
 
 
@@ -132,7 +136,7 @@ class LuminolIntro(Scene):
         self.show_examples()
 
         luminol = ChemWithName(
-            LUMINOL,
+            molecule("luminol"),
             "Luminol\\\\\\footnotesize (5-Amino-2,3-dihydrophthalazine-1,4-dione)",
         ).shift(UP)
         self.play(luminol.creation_anim())
@@ -481,7 +485,7 @@ class BasicForensicCaseOutline(Scene):
         self.wait(2)
 
 
-class LuminolReactionMechanism(MechanismScene):
+class LuminolReactionMechanism(CheckpointMixin, MechanismScene):
     steps_list = [
         "Deprotonation (removal\\\\of hydrogen) and\\\\dianion formation",
         "Rearrangement of charges\\\\(tautomerisation)",
@@ -496,7 +500,7 @@ class LuminolReactionMechanism(MechanismScene):
             extra_methods="shift(UP*0.65)",
         )
 
-        self.luminol = ChemWithName(LUMINOL, "Luminol").shift(LEFT * 3)
+        self.luminol = ChemWithName(molecule("luminol"), "Luminol").shift(LEFT * 3)
         self.hydroxide_1 = ChemObject("-OH").next_to(self.steps_header, LEFT, buff=0.75)
         self.hydroxide_2 = ChemObject("-OH").next_to(self.hydroxide_1, DOWN, buff=4.5)
 
@@ -506,6 +510,8 @@ class LuminolReactionMechanism(MechanismScene):
         self.step2()
         self.step3()
         self.step4()
+        ## For ReasonsBehindChemiluminescence
+        self.checkpoint("end", endoperoxide=endoperoxide, o2=self.o2)
 
     def step1(self):
         ## Step 1 start
@@ -589,13 +595,13 @@ class LuminolReactionMechanism(MechanismScene):
         global endoperoxide
         self.play(self.steps.animate.fade_all_but(2))
 
-        self.o2 = ChemObject(O2).next_to(self.luminol.chem, buff=0.75)
+        self.o2 = molecule("o2").next_to(self.luminol.chem, buff=0.75)
         self.o2.scale(0.75)
 
         self.play(Write(self.o2))
 
         self.play(
-            MoveAlongPath(
+            MoveAlongCurve(
                 self.o2[0][2],
                 ArcBetweenPoints(
                     self.o2[0][2].get_center(),
@@ -1018,7 +1024,7 @@ class LuminolInstagram(Scene):
         )
         self.add(watermark)
 
-        luminol = ChemWithName(LUMINOL, "Luminol")
+        luminol = ChemWithName(molecule("luminol"), "Luminol")
         hydroxide_1 = ChemObject("-OH").to_corner(UR, buff=1.5)
         hydroxide_2 = ChemObject("-OH").to_corner(DR, buff=1.5)
 
@@ -1085,12 +1091,12 @@ class LuminolInstagram(Scene):
             # luminol.chem[0][14].next_to,luminol.chem[0][15],DL,dict(buff=0.15)
         )
 
-        o2 = ChemObject(O2).to_edge(RIGHT, buff=2)
+        o2 = molecule("o2").to_edge(RIGHT, buff=2)
 
         self.play(Write(o2))
 
         self.play(
-            MoveAlongPath(
+            MoveAlongCurve(
                 o2[0][2],
                 ArcBetweenPoints(
                     o2[0][2].get_center(), o2[0][2].get_center() + UP + 0.05 * LEFT
@@ -1309,9 +1315,11 @@ class DisclaimerMechanismComplexAndABitUnknown(Scene):
 
 
 class ReasonsBehindChemiluminescence(LuminolReactionMechanism):
-    ##NOTE: Start render from 27th anim i.e. with `-n 27`
+    ##NOTE: Start render from 3rd anim i.e. with `-n 2`, past setup's first go.
     def construct(self):
-        super().construct()
+        global endoperoxide
+        checkpoint = self.resume_from(LuminolReactionMechanism, "end")
+        endoperoxide = checkpoint["endoperoxide"]
         self.o2 = self.o2.copy()
         self.clear()
         self.setup()
@@ -1459,7 +1467,7 @@ class ReasonsBehindChemiluminescence(LuminolReactionMechanism):
 
 
 class ReasonsBehindChemiluminescenceSecondPart(ReasonsBehindChemiluminescence):
-    # NOTE: Use -n 39 here
+    # NOTE: Use -n 14 here
     def construct(self):
         super().construct()
         self.add_endoperoxide_updaters()
@@ -1604,7 +1612,7 @@ class FadeInThenOut(Succession):
 class LogoScene(Scene):
     def construct(self):
         kilacoda = ChemWithName(
-            "K(-[1]I(-[::0]La(=[::90]Co(-[::-90]Da))))",
+            ChemObject("K(-[1]I(-[::0]La(=[::90]Co(-[::-90]Da))))"),
             "kilacoda",
             label_constructor=Text,
         )
@@ -1721,7 +1729,7 @@ class Thumbnail(Scene):
         luminol_name = Tex("Luminol").scale(1.5).set_color(DARK_BLUE)
         t2 = Text("work?").scale(0.75)
 
-        luminol = ChemObject(LUMINOL).scale(0.65)
+        luminol = molecule("luminol").scale(0.65)
         # photon = VGroup(Circle(BLUE, fill_opacity=0.8).scale(0.5), Tex("h$\\nu$"))
 
         example_photo = ImageMobject(Path("./references/luminol_light.jpg")).scale(0.5)
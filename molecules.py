@@ -0,0 +1,69 @@
+"""
+The structures that keep coming back across scenes, in one place.
+
+The chemfig codes are plain strings, so importing this costs nothing. `molecule`
+builds each structure the first time it's asked for (straight out of the chem
+cache if it's been built before) and hands out copies after that. To have them all
+compiled up front, in a single LaTeX run:
+
+    python molecules.py build
+"""
+
+import sys
+
+from chem_cache import CachedChemObject, precompile_chemfig_codes
+
+## luminol.py
+LUMINOL = "*6(-=*6(-(=O)-N(-H)-N(-H)-(=O)--)-=(-NH_2)-=)"
+DIANION_1 = "*6(-=*6(-(=O)-\\charge{45:2pt=$\\scriptstyle-$}{N}-\\charge{45:2pt=$\\scriptstyle-$}{N}-(=O)--)-=(-NH_2)-=)"
+O2 = "O(=[-2]O)"
+
+## pinacol.py
+PINACOL = "H_3C-C(-[2]CH_3)(-[-2]\\Charge{0:1.25pt=\\:,270:1.25pt=\\:}{O}-[4]H)-C(-[2]CH_3)(-[-2]\\Charge{180:1.25pt=\\:,270:1.25pt=\\:}{O}H)-CH_3"
+
+## Markovnikoff_addition.py
+PROP_1_ENE = "CH_3-CH=CH_2"
+PRIMARY_CARBOCATION = "CH_3-CH(-[-2]H)-\\charge{90:4pt=$\\oplus$}{C}H_2"
+SECONDARY_CARBOCATION = "CH_3-\\charge{90:4pt=$\\oplus$}{C}H-CH_2(-[-2]H)"
+GENERAL_PRIMARY_CARBOCATION = "R-\\charge{90:4pt=$+$}{C}H_2"
+GENERAL_SECONDARY_CARBOCATION = "R-\\charge{90:4pt=$+$}{C}H-R'"
+GENERAL_TERTIARY_CARBOCATION = "R-\\charge{60:4pt=$+$}{C}(-[2]R')-R''"
+TWO_BROMOPROPANE = "CH_3 - CH (-[2]Br) - CH_3"
+
+MOLECULES = {
+    "luminol": LUMINOL,
+    "dianion_1": DIANION_1,
+    "o2": O2,
+    "pinacol": PINACOL,
+    "prop-1-ene": PROP_1_ENE,
+    "primary_carbocation": PRIMARY_CARBOCATION,
+    "secondary_carbocation": SECONDARY_CARBOCATION,
+    "general_primary_carbocation": GENERAL_PRIMARY_CARBOCATION,
+    "general_secondary_carbocation": GENERAL_SECONDARY_CARBOCATION,
+    "general_tertiary_carbocation": GENERAL_TERTIARY_CARBOCATION,
+    "2-bromopropane": TWO_BROMOPROPANE,
+}
+
+_built = {}
+
+
+def molecule(name: str, **kwargs) -> CachedChemObject:
+    """
+    A fresh copy of the structure registered as `name`, free to be moved, recoloured
+    or animated without affecting anyone else's. `kwargs` go to `CachedChemObject`,
+    e.g. `molecule("pinacol", split_charges=True)`.
+    """
+    key = (name, repr(sorted(kwargs.items())))
+    if key not in _built:
+        _built[key] = CachedChemObject(MOLECULES[name], **kwargs)
+    return _built[key].copy()
+
+
+def build_molecules():
+    precompile_chemfig_codes((chem_code, {}) for chem_code in MOLECULES.values())
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] != ["build"]:
+        sys.exit(f"usage: {sys.argv[0]} build")
+    build_molecules()
@@ -1,7 +1,12 @@
 from chanim import *
+from chem_cache import CachedChemObject as ChemObject
+from curves import get_subpaths
+from molecules import molecule
+from rendering import StaticLayerScene, enable_shared_render_cache
 from math import degrees
 
 config.tex_template = TexTemplateLibrary.simple
+enable_shared_render_cache()
 
 
 class ReferenceGrid(VMobject):
@@ -86,17 +91,86 @@ class ReferenceGrid(VMobject):
         )
 
 
-class PinacolRearrangementMechanism(Scene):
+def get_line_points(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    Points of a straight line from each of `starts` to the matching one of `ends`,
+    as a (4n, 3) array of degenerate cubic Béziers, the same way `Line` builds them.
+    """
+    t = np.linspace(0, 1, 4)[None, :, None]
+    return (starts[:, None] + t * (ends - starts)[:, None]).reshape(-1, 3)
+
+
+class BatchedReferenceGrid(VMobject):
+    """
+    ReferenceGrid again, except every line lives in one point array instead of being
+    a Line of its own. That's split between three submobjects, one per style:
+    `deci_lines`, `int_lines` and `axes`, each just a view into it.
+
+    Since a layer is stroked in one go, lines crossing (or lying on top of) others in
+    the same layer don't get blended twice the way separate Lines do.
+    """
+
+    def __init__(self, axes_color=RED, **kwargs):
+        super().__init__(**kwargs)
+
+        xs = np.arange(
+            int(-config.frame_x_radius), int(config.frame_x_radius) + 1, dtype=float
+        )
+        ys = np.arange(
+            int(-config.frame_y_radius), int(config.frame_y_radius) + 1, dtype=float
+        )
+        tenths = np.arange(0, 11) * 0.1
+
+        def vertical(x):
+            return get_line_points(
+                np.column_stack([x, np.full_like(x, config.frame_y_radius), 0 * x]),
+                np.column_stack([x, np.full_like(x, -config.frame_y_radius), 0 * x]),
+            )
+
+        def horizontal(y):
+            return get_line_points(
+                np.column_stack([np.full_like(y, -config.frame_x_radius), y, 0 * y]),
+                np.column_stack([np.full_like(y, config.frame_x_radius), y, 0 * y]),
+            )
+
+        ## Same lines as ReferenceGrid, the axes pulled out into a layer of their own.
+        layers = [
+            np.concatenate(
+                [
+                    vertical((xs[None, :] + tenths[:, None]).ravel()),
+                    horizontal((ys[None, :] + tenths[:, None]).ravel()),
+                ]
+            ),
+            np.concatenate([vertical(xs[xs != 0]), horizontal(ys[ys != 0])]),
+            np.concatenate([vertical(np.zeros(1)), horizontal(np.zeros(1))]),
+        ]
+        self.grid_points = np.concatenate(layers)
+        bounds = np.cumsum([0] + [len(layer) for layer in layers])
+
+        self.deci_lines, self.int_lines, self.axes = VMobject(), VMobject(), VMobject()
+        for layer, start, end in zip(
+            [self.deci_lines, self.int_lines, self.axes], bounds, bounds[1:]
+        ):
+            layer.points = self.grid_points[start:end]
+
+        self.deci_lines.set_stroke(WHITE, width=0.85, opacity=0.25)
+        self.int_lines.set_stroke(WHITE, opacity=0.5)
+        self.axes.set_stroke(axes_color, opacity=0.5)
+
+        self.add(self.deci_lines, self.int_lines, self.axes)
+
+
+class PinacolRearrangementMechanism(StaticLayerScene, Scene):
     def construct(self):
-        ref_grid = ReferenceGrid()
+        ref_grid = BatchedReferenceGrid()
         # self.play(
         #     ShowCreation(ref_grid, run_time=7, rate_func=rate_functions.ease_in_cubic)
         # )
 
-        self.add(ref_grid)
+        self.add_static(ref_grid)
 
         pinacol = ChemWithName(
-            "H_3C-C(-[2]CH_3)(-[-2]\\Charge{0:1.25pt=\:,270:1.25pt=\:}{O}-[4]H)-C(-[2]CH_3)(-[-2]\\Charge{180:1.25pt=\:,270:1.25pt=\:}{O}H)-CH_3",
+            molecule("pinacol"),
             "Pinacol",
         )
 
@@ -116,7 +190,7 @@ class PinacolRearrangementMechanism(Scene):
 
         pinacol.chem[0][26].set_opacity(0)
 
-        dots = charge_to_dots(pinacol.chem[0][27])
+        dots = charges_to_dots([pinacol.chem[0][27]])[0]
 
         # self.play(
         #     pinacol.chem[0][27].animate.rotate(-90 * DEGREES).shift(DOWN * 0.1),
@@ -266,7 +340,7 @@ class PinacolRearrangementMechanism(Scene):
 
 
 ## aah frick.
-def charge_to_dots(charge: TexSymbol):
+def charge_to_dots(charge: TexSymbol, debug=False):
     """
     Made to get around the problems caused by `chemfig`'s new `\charge` macro.
     Apparently, manim doesn't convert both the dots rendered through this macro to
@@ -280,7 +354,11 @@ def charge_to_dots(charge: TexSymbol):
     )  ## Will be rotated such that it's perpendicular to the x-axis
     # arrange_direction = normalize(rotate_vector(charge_copy.get_center(), 90 * DEGREES))
 
-    arrange_direction = normalize(charge_copy.get_end() - charge_copy.get_start())
+    arrange_direction = charge_copy.get_end() - charge_copy.get_start()
+    if not np.any(arrange_direction):
+        ## Path ends where it starts, go with the long side of the glyph instead.
+        arrange_direction = RIGHT if charge_copy.width >= charge_copy.height else UP
+    arrange_direction = normalize(arrange_direction)
 
     ## Debug stuff
     # console.print(f"{charge_copy.get_center()=}")
@@ -289,12 +367,14 @@ def charge_to_dots(charge: TexSymbol):
     # console.print(f"{charge.points=}")
     # console.print(f"{charge_copy.get_start()=}")
     # console.print(f"{charge.get_start()=}")
-    console.print(f"{degrees(angle_of_vector(charge_copy.get_center()))=}")
-    console.print(arrange_direction)
-    console.print(
-        f"Angle of arrange_direction = {degrees(angle_of_vector(arrange_direction))}"
-    )
-    console.print(degrees(90 * DEGREES - angle_of_vector(arrange_direction)))
+    if debug:
+        console.print(f"{degrees(angle_of_vector(charge_copy.get_center()))=}")
+        console.print(arrange_direction)
+        console.print(
+            "Angle of arrange_direction = "
+            f"{degrees(angle_of_vector(arrange_direction))}"
+        )
+        console.print(degrees(90 * DEGREES - angle_of_vector(arrange_direction)))
 
     charge_copy.rotate(
         90 * DEGREES - angle_of_vector(arrange_direction)
@@ -309,8 +389,9 @@ def charge_to_dots(charge: TexSymbol):
     buff = buff_line.get_length() / 2
 
     ## More debug stuff...
-    console.print(f"{buff=}")
-    console.print(-arrange_direction * (buff))
+    if debug:
+        console.print(f"{buff=}")
+        console.print(-arrange_direction * (buff))
 
     # scale factor determined via trial and error.
     dots = VGroup(Dot().scale(0.55), Dot().scale(0.55))
@@ -326,6 +407,88 @@ def charge_to_dots(charge: TexSymbol):
     return dots
 
 
+def charges_to_dots(charges, debug=False) -> list:
+    """
+    `charge_to_dots` for a whole bunch of charge symbols at once. Rather than copying
+    and rotating each one, the rotated extents all come out of one pass over their
+    concatenated points.
+    """
+    charges = list(charges)
+    if not charges:
+        return []
+    points = [charge.get_all_points() for charge in charges]
+    counts = np.array([len(p) for p in points])
+    offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    all_points = np.concatenate(points)
+
+    starts = all_points[offsets]
+    ends = all_points[offsets + counts - 1]
+    directions = ends - starts
+    mins = np.minimum.reduceat(all_points, offsets)
+    maxs = np.maximum.reduceat(all_points, offsets)
+    centers = (mins + maxs) / 2
+
+    norms = np.linalg.norm(directions, axis=1)
+    closed = norms == 0
+    ## Same fallback as charge_to_dots for paths that end where they start.
+    sizes = maxs - mins
+    directions[closed] = np.where(
+        (sizes[closed, 0] >= sizes[closed, 1])[:, None], RIGHT, UP
+    )
+    norms[closed] = 1
+    directions /= norms[:, None]
+
+    ## Rotating by 90° - angle leaves the height along y as sin(θ)x + cos(θ)y.
+    rotations = PI / 2 - np.arctan2(directions[:, 1], directions[:, 0])
+    sines = np.repeat(np.sin(rotations), counts)
+    cosines = np.repeat(np.cos(rotations), counts)
+    rotated_y = sines * all_points[:, 0] + cosines * all_points[:, 1]
+    heights = np.maximum.reduceat(rotated_y, offsets) - np.minimum.reduceat(
+        rotated_y, offsets
+    )
+    ## Same 0.0325 trimmed off either end as buff_line.
+    buffs = np.abs(heights - 2 * 0.0325) / 2
+
+    if debug:
+        console.print(f"{np.degrees(rotations)=}")
+        console.print(f"{buffs=}")
+
+    template = Dot().scale(0.55)
+    all_dots = []
+    for center, direction, buff in zip(centers, directions, buffs):
+        dots = VGroup(
+            template.copy().move_to(center - direction * buff),
+            template.copy().move_to(center + direction * buff),
+        )
+        dots.buff = buff
+        all_dots.append(dots)
+    return all_dots
+
+
+def find_charge_glyphs(chem: ChemObject, max_dot_size=0.1) -> list:
+    """
+    The glyphs of `chem` that are a `\\charge` pair of dots, i.e. made of exactly
+    two subpaths, each no bigger than `max_dot_size` either way.
+    """
+    glyphs = []
+    for glyph in chem.family_members_with_points():
+        subpaths = get_subpaths(glyph.points)
+        if len(subpaths) != 2:
+            continue
+        sizes = [np.ptp(subpath.reshape(-1, 3), axis=0).max() for subpath in subpaths]
+        if max(sizes) <= max_dot_size:
+            glyphs.append(glyph)
+    return glyphs
+
+
+def chem_charges_to_dots(chem: ChemObject, debug=False) -> list:
+    """
+    Turns every charge glyph `find_charge_glyphs` finds in `chem` into a pair of
+    `Dot`s, in the order they appear in.
+    """
+    return charges_to_dots(find_charge_glyphs(chem), debug=debug)
+
+
 class TestCharge(Scene):
     def construct(self):
         self.camera.background_color = GREEN
@@ -342,7 +505,7 @@ class TestCharge(Scene):
         #     ),
         # )
 
-        dots_from_charge = charge_to_dots(charge[0][0])
+        dots_from_charge = charges_to_dots([charge[0][0]])[0]
 
         self.add(
             charge.set_color(RED),
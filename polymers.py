@@ -1,5 +1,36 @@
+import hashlib
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
 from typing import Iterable
 from chanim import *
+from curves import bezier_intersections
+
+
+def get_submob_centers(mob: VMobject) -> np.ndarray:
+    """
+    Centers of every submobject of `mob` stacked into a single (N, 3) array, so
+    overlap checks can be done in one go instead of pair by pair.
+    """
+    return np.array([item.get_center() for item in mob]).reshape(-1, 3)
+
+
+def centers_overlap(
+    centers1: np.ndarray, centers2: np.ndarray, tolerance=0.5, chunk_size=64
+) -> bool:
+    """
+    Whether any center in `centers1` lies within `tolerance` of any center in
+    `centers2`. The pairwise distances are broadcast `chunk_size` rows at a time,
+    bailing out as soon as a chunk has a hit.
+    """
+    tolerance_sq = tolerance**2
+    for start in range(0, len(centers1), chunk_size):
+        diffs = centers1[start : start + chunk_size, None, :] - centers2[None, :, :]
+        if (np.einsum("ijk,ijk->ij", diffs, diffs) < tolerance_sq).any():
+            return True
+    return False
 
 
 def overlap_exists(
@@ -8,26 +39,85 @@ def overlap_exists(
     if not check_all_submobs:
         return abs(get_norm(mob1.get_center() - mob2.get_center())) < tolerance
     else:
-        return any(
-            [
-                get_norm(item1.get_center() - item2.get_center()) < tolerance
-                for item1 in mob1
-                for item2 in mob2
-            ]
+        return centers_overlap(
+            get_submob_centers(mob1), get_submob_centers(mob2), tolerance
         )
 
 
+def find_step_out(
+    moving_centers: np.ndarray,
+    fixed_centers: np.ndarray,
+    step: np.ndarray,
+    tolerance=0.5,
+) -> int:
+    """
+    Smallest number of `step`s `moving_centers` has to be shifted by so that none of
+    them is within `tolerance` of `fixed_centers`, i.e. what nudging the unit outward
+    one step at a time until `centers_overlap` turns false would land on.
+
+    Rather than testing each step, every pair of centers is solved for directly:
+    |d + k * step| < tolerance is a quadratic in k, so each pair overlaps over an
+    open interval of k. The answer is the first integer not covered by any of them.
+    """
+    diffs = (moving_centers[:, None, :] - fixed_centers[None, :, :]).reshape(-1, 3)
+    a = np.dot(step, step)
+    b = diffs @ step
+    c = np.einsum("ij,ij->i", diffs, diffs) - tolerance**2
+
+    if a == 0:
+        if (c < 0).any():
+            raise ValueError("Can't step out of an overlap with a zero step.")
+        return 0
+
+    discriminants = b**2 - a * c
+    hit = discriminants > 0
+    roots = np.sqrt(discriminants[hit])
+    starts = (-b[hit] - roots) / a
+    ends = (-b[hit] + roots) / a
+
+    num_steps = 0
+    for start, end in sorted(zip(starts, ends)):
+        if start >= num_steps:
+            ## Sorted by start, so nothing after this covers num_steps either.
+            break
+        if end > num_steps:
+            num_steps = int(np.ceil(end))
+    return num_steps
+
+
+class SpatialHash:
+    """
+    Uniform grid over the xy-plane that buckets points by cell, so "what's near this
+    point?" only has to look at the 3x3 block of cells around it instead of at
+    everything that's been inserted so far.
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def _cell_of(self, point: np.ndarray):
+        return tuple(np.floor(point[:2] / self.cell_size).astype(int))
+
+    def insert(self, key, point: np.ndarray):
+        self.cells.setdefault(self._cell_of(point), []).append(key)
+
+    def nearby(self, point: np.ndarray) -> Iterable:
+        """
+        Keys of everything inserted within `cell_size` (in x and y) of `point`,
+        plus whatever else shares those cells.
+        """
+        cx, cy = self._cell_of(point)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                yield from self.cells.get((cx + dx, cy + dy), ())
+
+
 def Range(in_val, end_val, step=1):
     return list(np.arange(in_val, end_val + step, step))
 
 
 class TestScene(Scene):
-    # CONFIG = {"dx": 0.005}
-    dx = 0.005
-
-    def get_coord_from_proportion(self, vmob, proportion):
-        return vmob.point_from_proportion(proportion)
-
     def construct(self):
         circle1 = ChemObject(Benzene)
         circle2 = ChemObject(Benzene)
@@ -40,46 +130,40 @@ class TestScene(Scene):
         for point in intersections:
             self.add(Dot(radius=0.05).move_to(point))
 
-    def get_points_from_curve(self, vmob):
-        coords = []
-        for point in Range(0, 1, self.dx):
-            dot = Dot(self.get_coord_from_proportion(vmob, point))
-            coords.append(dot.get_center())
-        return coords
-
     def get_intersections_between_two_vmobs(
         self,
         vmob1,
         vmob2,
-        tolerance=0.05,
+        tolerance=None,
         radius_error=0.2,
-        use_average=True,
-        use_first_vmob_reference=False,
+        use_average=None,
+        use_first_vmob_reference=None,
+        box_size=1e-3,
     ):
-        coords_1 = self.get_points_from_curve(vmob1)
-        coords_2 = self.get_points_from_curve(vmob2)
-        intersections = []
-        for coord_1 in coords_1:
-            for coord_2 in coords_2:
-                distance_between_points = get_norm(coord_1 - coord_2)
-                if use_average:
-                    coord_3 = (coord_2 - coord_1) / 2
-                    average_point = coord_1 + coord_3
-                else:
-                    if use_first_vmob_reference:
-                        average_point = coord_1
-                    else:
-                        average_point = coord_2
-                if len(intersections) > 0 and distance_between_points < tolerance:
-                    last_intersection = intersections[-1]
-                    distance_between_previus_point = get_norm(
-                        average_point - last_intersection
-                    )
-                    if distance_between_previus_point > radius_error:
-                        intersections.append(average_point)
-                if len(intersections) == 0 and distance_between_points < tolerance:
-                    intersections.append(average_point)
-        return intersections
+        """
+        Where `vmob1` and `vmob2` cross, found exactly on their Bezier curves (see
+        `bezier_intersections`) to within `box_size`. Crossings closer than
+        `radius_error` are merged.
+
+        `tolerance`, `use_average` and `use_first_vmob_reference` belonged to the
+        old sampling version. They're still accepted, but ignored: there are no
+        samples to be `tolerance` apart anymore, and an exact crossing is the same
+        point on both curves, so there's nothing to average or pick between.
+        """
+        ignored = {
+            "tolerance": tolerance,
+            "use_average": use_average,
+            "use_first_vmob_reference": use_first_vmob_reference,
+        }
+        ignored = [name for name, value in ignored.items() if value is not None]
+        if ignored:
+            logger.warning(
+                f"get_intersections_between_two_vmobs ignores {', '.join(ignored)}, "
+                "use box_size to set how precisely crossings are found."
+            )
+        return bezier_intersections(
+            vmob1, vmob2, tolerance=box_size, merge_distance=radius_error
+        )
 
 
 class OverlapTest(Scene):
@@ -91,6 +175,341 @@ class OverlapTest(Scene):
         self.add(c1, c2, ArcPolygon())
 
 
+def solve_step_out(
+    base_centers: np.ndarray,
+    base_center: np.ndarray,
+    half_width: float,
+    repetition_index: int,
+) -> np.ndarray:
+    """
+    Offset from a unit to its repetition through `repetition_index`, given the unit's
+    submobject centers, its center and half its width.
+    """
+    glyph_offset = base_centers[repetition_index] - base_center
+    step = half_width * normalize(glyph_offset) * 0.02
+    num_steps = find_step_out(base_centers + glyph_offset, base_centers, step)
+    return glyph_offset + num_steps * step
+
+
+def find_clear_centers(
+    centers: np.ndarray, placed_centers: np.ndarray, tolerance: float
+) -> np.ndarray:
+    """
+    Which of `centers` aren't within `tolerance` of any of `placed_centers`, using
+    the same check as `PolymerLayout.place`. Module level so it can be handed to
+    worker processes.
+    """
+    index = SpatialHash(tolerance)
+    for i, center in enumerate(placed_centers):
+        index.insert(i, center)
+    return np.array(
+        [
+            not any(
+                get_norm(placed_centers[i] - center) < tolerance
+                for i in index.nearby(center)
+            )
+            for center in centers
+        ],
+        dtype=bool,
+    )
+
+
+def get_polymer_layout_cache_dir() -> Path:
+    return Path(config.media_dir) / "polymer_layouts"
+
+
+class SharedPoints:
+    """
+    A (read only) points array that copies of a mobject keep sharing instead of
+    each getting their own, pickled just once however many share it.
+    """
+
+    def __init__(self, array: np.ndarray):
+        self.array = np.array(array, dtype=float)
+        self.array.flags.writeable = False
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class PointsCache:
+    """
+    Holds an instanced member's worked out points. Copies (and pickles) of the
+    member start out with an empty one rather than a copy of the points.
+    """
+
+    __slots__ = ("array",)
+
+    def __init__(self):
+        self.array = None
+
+    def __deepcopy__(self, memo):
+        return PointsCache()
+
+    def __reduce__(self):
+        return PointsCache, ()
+
+
+class InstancedArray(np.ndarray):
+    """
+    What an instanced member hands out as its points. Writing into it (or into a
+    view of it) first makes it the member's own points, so the write sticks.
+    """
+
+    def __array_finalize__(self, obj):
+        self.owner = getattr(obj, "owner", None)
+
+    def claim(self):
+        if self.owner is not None:
+            self.owner.claim_points(self)
+
+    def __setitem__(self, key, value):
+        self.claim()
+        super().__setitem__(key, value)
+
+    def __iadd__(self, other):
+        self.claim()
+        return super().__iadd__(other)
+
+    def __isub__(self, other):
+        self.claim()
+        return super().__isub__(other)
+
+    def __imul__(self, other):
+        self.claim()
+        return super().__imul__(other)
+
+    def __itruediv__(self, other):
+        self.claim()
+        return super().__itruediv__(other)
+
+
+class InstancedPoints:
+    """
+    Mixed into every member of a `Polymer`'s units by `make_instanced`. Until
+    something gives a member points of its own, its points are worked out from the
+    points of the matching member of the base unit (which every unit shares) and a
+    transform of its own, `shared @ matrix.T + offset`, and kept until the
+    transform changes. Moving, scaling or rotating the whole polymer only updates
+    those transforms.
+
+    Assigning `points`, or writing into them in place, gives the member its own
+    copy from then on, just like it'd have had all along.
+    """
+
+    @property
+    def points(self) -> np.ndarray:
+        points = self.__dict__["_own_points"]
+        if points is not None:
+            return points
+        cache = self.__dict__["_points_cache"]
+        if cache.array is None:
+            cache.array = (
+                self._shared_points.array @ self._instance_matrix.T
+                + self._instance_offset
+            ).view(InstancedArray)
+            cache.array.owner = self
+        return cache.array
+
+    @points.setter
+    def points(self, points: np.ndarray):
+        self.__dict__["_own_points"] = np.asarray(points)
+        self.__dict__["_points_cache"] = PointsCache()
+
+    def claim_points(self, array: np.ndarray):
+        """
+        Called before `array` is written into: if it's (part of) the worked out
+        points, they become the member's own.
+        """
+        cache = self.__dict__["_points_cache"].array
+        if (
+            self.is_instanced()
+            and cache is not None
+            and np.may_share_memory(array, cache)
+        ):
+            self.__dict__["_own_points"] = cache.view(np.ndarray)
+
+    def is_instanced(self) -> bool:
+        return self.__dict__["_own_points"] is None
+
+    def has_points(self) -> bool:
+        return self.get_num_points() > 0
+
+    def get_num_points(self) -> int:
+        if self.is_instanced():
+            return len(self._shared_points.array)
+        return len(self.points)
+
+    def transform_instance(self, matrix: np.ndarray, shift: np.ndarray):
+        """
+        Follows the member's transform up with `points @ matrix.T + shift`.
+        """
+        self._instance_matrix = matrix @ self._instance_matrix
+        self._instance_offset = self._instance_offset @ matrix.T + shift
+        self.__dict__["_points_cache"] = PointsCache()
+
+    def __reduce_ex__(self, protocol):
+        ## The classes are made on the fly, so they're pickled as the class they're
+        ## made from, and made again when unpickling.
+        return make_instanced_object, (self._instanced_base,), dict(self.__dict__)
+
+
+_instanced_classes = {}
+
+
+def get_instanced_class(cls: type) -> type:
+    """
+    `cls` with `InstancedPoints` mixed in, made the first time it's needed and also
+    kept as a module level `Instanced<cls>`.
+    """
+    if cls not in _instanced_classes:
+        name = f"Instanced{cls.__name__}"
+        while name in globals():
+            name += "_"
+        instanced_class = type(cls)(
+            name,
+            (InstancedPoints, cls),
+            {"__module__": __name__, "__qualname__": name, "_instanced_base": cls},
+        )
+        globals()[name] = _instanced_classes[cls] = instanced_class
+    return _instanced_classes[cls]
+
+
+def make_instanced_object(cls: type) -> InstancedPoints:
+    instanced_class = get_instanced_class(cls)
+    return instanced_class.__new__(instanced_class)
+
+
+def make_instanced(mob: Mobject) -> Mobject:
+    """
+    Turns every member of `mob` into an `InstancedPoints` one, sharing its current
+    points with all copies of it that get made from now on.
+    """
+    for member in mob.get_family():
+        if isinstance(member, InstancedPoints):
+            continue
+        member._shared_points = SharedPoints(member.__dict__.pop("points"))
+        member._instance_matrix = np.identity(3)
+        member._instance_offset = np.zeros(3)
+        member._own_points = None
+        member._points_cache = PointsCache()
+        member.__class__ = get_instanced_class(type(member))
+    return mob
+
+
+def get_linear_map(func) -> np.ndarray:
+    """
+    The matrix `func` multiplies points by, if it's linear (as the ones `scale`,
+    `rotate`, `stretch` and `apply_matrix` pass along are), None otherwise.
+    """
+    matrix = func(np.identity(3)).T
+    probe = np.array([[0.0, 0.0, 0.0], [0.31, -1.7, 2.9], [-4.3, 0.59, 1.3]])
+    if not np.allclose(func(probe.copy()), probe @ matrix.T):
+        return None
+    return matrix
+
+
+class PolymerLayout:
+    """
+    Where the repeat units of a polymer go, kept as plain translations of one
+    canonical base unit instead of as copies of it. Every unit of a `Polymer` is the
+    base unit shifted by one of `offsets`, so placing a candidate repetition is just
+    a bit of arithmetic on the base unit's submobject centers. The units themselves
+    don't get copies of the points either, see `InstancedPoints`.
+    """
+
+    def __init__(self, base_unit: ChemObject, tolerance=0.05):
+        self.base_centers = get_submob_centers(base_unit[0])
+        self.base_center = base_unit.get_center()
+        self.half_width = get_norm(base_unit.get_left() - base_unit.get_center())
+        self.tolerance = tolerance
+
+        self.offsets = []
+        ## Unit centers, bucketed so placement checks only look at nearby units.
+        self.index = SpatialHash(tolerance)
+        ## How far a repetition gets pushed out only depends on its repetition index.
+        self._step_outs = {}
+
+        ## Bookkeeping for bench_polymers.py.
+        self.collision_checks = 0
+
+    def add(self, offset: np.ndarray):
+        self.index.insert(len(self.offsets), self.base_center + offset)
+        self.offsets.append(offset)
+
+    def step_out(self, repetition_index: int) -> np.ndarray:
+        """
+        Offset from a unit to its repetition through `repetition_index`: moved onto
+        that submobject, then pushed outward until it no longer overlaps the unit.
+        """
+        if repetition_index not in self._step_outs:
+            self._step_outs[repetition_index] = solve_step_out(
+                self.base_centers, self.base_center, self.half_width, repetition_index
+            )
+        return self._step_outs[repetition_index]
+
+    def place(self, offset: np.ndarray, repetition_index: int):
+        """
+        Offset of the repetition of the unit at `offset` through `repetition_index`,
+        or None if it would land on a unit that's already been placed.
+        """
+        candidate = offset + self.step_out(repetition_index)
+        center = self.base_center + candidate
+        for i in self.index.nearby(center):
+            self.collision_checks += 1
+            if get_norm(self.base_center + self.offsets[i] - center) < self.tolerance:
+                return None
+        return candidate
+
+    def place_all(
+        self,
+        offsets: np.ndarray,
+        repetition_indices: Iterable[int],
+        pool: ProcessPoolExecutor,
+        num_chunks: int,
+    ):
+        """
+        Candidate offsets for the repetitions of every unit at `offsets` through
+        every one of `repetition_indices`, in the order `place` would be called for
+        them, along with whether each one is clear of the units placed so far. The
+        checks are split into `num_chunks` chunks and run on `pool`.
+
+        Candidates aren't checked against each other, see `collides`.
+        """
+        step_outs = np.array([self.step_out(i) for i in repetition_indices])
+        candidates = (offsets[:, None, :] + step_outs[None, :, :]).reshape(-1, 3)
+        centers = self.base_center + candidates
+        placed_centers = self.base_center + np.array(self.offsets).reshape(-1, 3)
+
+        chunks = np.array_split(centers, min(num_chunks, len(centers)))
+        ## Each worker only needs the placed units around its own chunk.
+        nearby_placed = [
+            placed_centers[
+                (placed_centers >= chunk.min(axis=0) - self.tolerance).all(axis=1)
+                & (placed_centers <= chunk.max(axis=0) + self.tolerance).all(axis=1)
+            ]
+            for chunk in chunks
+        ]
+        clear = pool.map(
+            find_clear_centers, chunks, nearby_placed, repeat(self.tolerance)
+        )
+        return candidates, np.concatenate(list(clear))
+
+    def collides(self, offset: np.ndarray, since: int) -> bool:
+        """
+        Whether a unit at `offset` would land on one of the units placed since the
+        first `since` were.
+        """
+        center = self.base_center + offset
+        for i in self.index.nearby(center):
+            if i < since:
+                continue
+            self.collision_checks += 1
+            if get_norm(self.base_center + self.offsets[i] - center) < self.tolerance:
+                return True
+        return False
+
+
 class Polymer(VMobject):
     def __init__(
         self,
@@ -99,6 +518,9 @@ class Polymer(VMobject):
         num_repetitions: int = None,
         include_base: bool = True,
         _overlap_check_tolerance=0.05,
+        cache_layout: bool = False,
+        defer_growth: bool = False,
+        processes: int = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -107,22 +529,81 @@ class Polymer(VMobject):
         self.base_unit = base_unit = (
             ChemObject(base_unit) if type(base_unit) == str else base_unit
         )
+        ## Stays where the polymer was first laid out, transforming the polymer
+        ## doesn't touch it. layout_transform is how to get from there to wherever
+        ## the polymer is now, or None once it's been through something other than
+        ## an affine map.
+        self.layout = PolymerLayout(base_unit, _overlap_check_tolerance)
+        self.layout_transform = (np.identity(3), np.zeros(3))
+        ## Taken before anyone gets to move the base unit.
+        self.unit_template = self.make_unit_template(base_unit)
+        self.layout_probe = None
 
         if include_base:
-            self.add(base_unit)
+            self.add_unit(np.zeros(3), base_unit)
 
         self.start_index = 1 if include_base else 0
 
         if repetition_indices is None:
-            self.repetition_indices = repetition_indices = [0, len(base_unit[0]) - 1]
-
-        increment = 1
+            repetition_indices = [0, len(base_unit[0]) - 1]
 
         if num_repetitions is None:
-            self.num_repetitions = num_repetitions = len(repetition_indices)
+            num_repetitions = len(repetition_indices)
+        self.repetition_indices = repetition_indices
+        self.num_repetitions = num_repetitions
         # self.add(index_labels(base_unit[0]))
         self.reps_done: int = 0
-        if num_repetitions > len(repetition_indices):
+        ## Worker processes to check placements on, see grow_in_parallel.
+        self.processes = processes
+
+        self.layout_cache_file = (
+            self.get_layout_cache_file(
+                repetition_indices, num_repetitions, include_base
+            )
+            if cache_layout
+            else None
+        )
+
+        if not defer_growth:
+            for _ in self.grow():
+                pass
+
+    def grow(self):
+        """
+        Lays the polymer out one unit at a time, adding each unit to the polymer and
+        yielding it as soon as it's been placed. Scenes built with
+        `defer_growth=True` can animate the first units while later ones are still
+        being laid out, or stop whenever they like and keep the shorter chain.
+
+        The polymer can be shifted, scaled, rotated and so on in the meantime, new
+        units get the same transforms. Anything else (`apply_function`, animating
+        it) raises a ValueError on the next unit, since there's no telling where
+        that should go.
+
+        With `processes` set, units are laid out by `grow_in_parallel` instead,
+        which gives exactly the same polymer.
+        """
+        base_unit = self.base_unit
+        repetition_indices = self.repetition_indices
+        num_repetitions = self.num_repetitions
+        layout_cache_file = self.layout_cache_file
+        increment = 1
+
+        cached_offsets = (
+            self.load_layout(layout_cache_file)
+            if layout_cache_file is not None
+            else None
+        )
+        if cached_offsets is not None:
+            for offset in cached_offsets[len(self.layout.offsets) :]:
+                unit = self.add_unit(offset)
+                self.reps_done += 1
+                yield unit
+        elif num_repetitions > len(repetition_indices) and (
+            self.processes is not None and self.processes > 1
+        ):
+            yield from self.grow_in_parallel()
+        elif num_repetitions > len(repetition_indices):
             rounds_done: int = self.reps_done // increment
             # self.repeatable_bases = self.submobjects
             # base_groups = [[base_unit]]
@@ -137,7 +618,9 @@ class Polymer(VMobject):
                 for index in repetition_indices:
                     # print(f"{self.reps_done=}")
                     # curr_mob.set_color(random_color())
-                    self.add_repetition(curr_mob, index)
+                    unit = self.add_repetition(curr_mob, index)
+                    if unit is not None:
+                        yield unit
                     # curr_mob.set_color(WHITE)
                     # else:
                     # for index in repetition_indices:
@@ -149,7 +632,7 @@ class Polymer(VMobject):
                 # print_family(self)
                 # print(len(self))
                 # print(self.start_index - 1)
-                curr_mob = self[self.start_index - 1]
+                curr_mob = self.start_index - 1
                 # print_family(curr_mob)
                 # print(f"{len(self.repeatable_bases)=}\n")
                 # print(f"{(self.reps_done<num_repetitions)=}\n")
@@ -181,47 +664,376 @@ class Polymer(VMobject):
         elif num_repetitions <= len(repetition_indices):
             indices = repetition_indices[:num_repetitions]
             for index in repetition_indices:
-                self.add_repetition(base_unit, index)
+                unit = self.add_repetition(base_unit, index)
+                if unit is not None:
+                    yield unit
+
+        if layout_cache_file is not None and cached_offsets is None:
+            self.save_layout(layout_cache_file)
+
+    def grow_in_parallel(self):
+        """
+        Lays out the same units as the serial loop in `grow`, a frontier at a time.
+        The candidates for every unit in the frontier are checked against the units
+        placed before it on a pool of `processes` worker processes, then taken in
+        the order the serial loop would've tried them, each one also checked against
+        those taken earlier in the frontier. Only pays off for branched polymers,
+        where the frontiers get wide.
+        """
+        layout = self.layout
+        repetition_indices = self.repetition_indices
+        num_repetitions = self.num_repetitions
+        ## Units whose repetitions haven't been tried yet, same order as the serial
+        ## loop: the base unit, then the units placed after it.
+        base_pending = True
+        next_parent = self.start_index
+
+        with ProcessPoolExecutor(self.processes) as pool:
+            while self.reps_done < num_repetitions:
+                ## No point checking more than could possibly be needed.
+                remaining = num_repetitions - self.reps_done
+                num_parents = -(-remaining // len(repetition_indices))
+                parents = [np.zeros(3)] if base_pending else []
+                from_layout = layout.offsets[
+                    next_parent : next_parent + num_parents - len(parents)
+                ]
+                parents += from_layout
+                if not parents:
+                    break
+                base_pending = False
+                next_parent += len(from_layout)
+
+                num_placed = len(layout.offsets)
+                candidates, clear = layout.place_all(
+                    np.array(parents), repetition_indices, pool, self.processes
+                )
+                candidates = candidates.reshape(len(parents), -1, 3)
+                clear = clear.reshape(len(parents), -1)
+                for parent_candidates, parent_clear in zip(candidates, clear):
+                    if self.reps_done >= num_repetitions:
+                        break
+                    for offset, is_clear in zip(parent_candidates, parent_clear):
+                        if is_clear and not layout.collides(offset, num_placed):
+                            unit = self.add_unit(offset)
+                            self.reps_done += 1
+                            yield unit
 
     def add_repetition(
         self, mob_or_index: Union[ChemObject, int], repetition_index: int
     ):
-        base_unit = self[mob_or_index] if type(mob_or_index) == int else mob_or_index
-
-        # self.add(index_labels(base_unit[0]).set_color(random_color()))
-        # print(f"{repetition_indices=}\n")
-        # for i in repetition_indices:
-        temp_base_unit_copy = base_unit.copy()
-        temp_base_unit_copy.move_to(base_unit[0][repetition_index])
-        print(
-            overlap_exists(temp_base_unit_copy[0], base_unit[0], check_all_submobs=True)
-        )
-        while overlap_exists(
-            temp_base_unit_copy[0], base_unit[0], check_all_submobs=True
+        offset = self.layout.place(self.get_unit_offset(mob_or_index), repetition_index)
+        if offset is None:
+            return
+
+        unit = self.add_unit(offset)
+        self.reps_done += 1
+        return unit
+
+    def make_unit_template(self, base_unit: ChemObject) -> ChemObject:
+        """
+        What every unit (but the base unit itself) is an instance of.
+        """
+        template = make_instanced(base_unit.copy())
+        self.template_centroid = template.get_all_points().mean(axis=0)
+        return template
+
+    def add_unit(self, offset: np.ndarray, unit: ChemObject = None) -> ChemObject:
+        """
+        Records a placed unit in the layout and adds its mobject, made from the base
+        unit unless one's given.
+        """
+        if unit is None:
+            self.check_layout_transform()
+            unit = self.materialize_unit(offset)
+            if self.layout_probe is None:
+                ## One the polymer made itself, rather than the base unit the scene
+                ## passed in (and may well move on its own).
+                self.layout_probe = (unit, self.template_centroid + offset)
+        self.layout.add(offset)
+        self.add(unit)
+        return unit
+
+    def follow_layout_transform(self, matrix: np.ndarray, shift: np.ndarray):
+        if self.layout_transform is not None:
+            layout_matrix, layout_shift = self.layout_transform
+            self.layout_transform = (
+                matrix @ layout_matrix,
+                layout_shift @ matrix.T + shift,
+            )
+
+    def check_layout_transform(self):
+        """
+        Makes sure `layout_transform` still says where the polymer is, by checking
+        where the first unit it made has ended up.
+        """
+        lost_track = self.layout_transform is None
+        if not lost_track and self.layout_probe is not None:
+            unit, centroid = self.layout_probe
+            matrix, shift = self.layout_transform
+            lost_track = not np.allclose(
+                unit.get_all_points().mean(axis=0), centroid @ matrix.T + shift
+            )
+        if lost_track:
+            raise ValueError(
+                "The polymer, or one of its units, has been changed in a way grow() "
+                "can't follow (apply_function, animating it, moving a single unit...), "
+                "so there's no telling where new units go. Until it's done growing, "
+                "only shift, scale, rotate etc. the polymer as a whole."
+            )
+
+    def get_unit_offset(self, mob_or_index: Union[ChemObject, int]) -> np.ndarray:
+        """
+        How far a unit of the polymer (or the base unit, even if it isn't included)
+        is shifted from the base unit.
+        """
+        if type(mob_or_index) == int:
+            return self.layout.offsets[mob_or_index]
+        if mob_or_index is self.base_unit:
+            return np.zeros(3)
+        return self.layout.offsets[self.submobjects.index(mob_or_index)]
+
+    def get_layout_cache_file(
+        self,
+        repetition_indices: Iterable[int],
+        num_repetitions: int,
+        include_base: bool,
+    ) -> Path:
+        """
+        Where the layout for these settings is cached. The key hashes the base unit's
+        geometry rather than its chemfig code, which also covers the template and
+        any styling that changes its shape.
+        """
+        hasher = hashlib.sha256()
+        for array in (
+            self.layout.base_centers,
+            self.layout.base_center,
+            self.layout.half_width,
         ):
-            temp_base_unit_copy.shift(
+            hasher.update(np.ascontiguousarray(array, dtype=np.float64).tobytes())
+        hasher.update(
+            repr(
                 (
-                    get_norm(
-                        temp_base_unit_copy.get_left()
-                        - temp_base_unit_copy.get_center()
-                    )
+                    list(repetition_indices),
+                    num_repetitions,
+                    include_base,
+                    self._overlap_check_tolerance,
                 )
-                * normalize(
-                    base_unit[0][repetition_index].get_center() - base_unit.get_center()
-                )
-                * 0.02
+            ).encode()
+        )
+        return get_polymer_layout_cache_dir() / f"{hasher.hexdigest()[:32]}.npz"
+
+    def load_layout(self, file: Path) -> np.ndarray:
+        """
+        Offsets cached in `file`, or None if there aren't any usable ones there (in
+        which case the layout gets worked out again and the file overwritten).
+        """
+        if not file.exists():
+            return None
+        try:
+            with np.load(file) as cached:
+                offsets = cached["offsets"].reshape(-1, 3).astype(float)
+        except (OSError, EOFError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            logger.warning(f"Ignoring unreadable polymer layout cache {file}: {e}")
+            return None
+        return offsets
+
+    def save_layout(self, file: Path):
+        file.parent.mkdir(parents=True, exist_ok=True)
+        ## Write somewhere else first so a render running alongside never sees half
+        ## a file.
+        temp_file = file.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_file, "wb") as f:
+            np.savez(f, offsets=np.array(self.layout.offsets).reshape(-1, 3))
+        os.replace(temp_file, file)
+
+    def materialize_unit(self, offset: np.ndarray) -> ChemObject:
+        """
+        The actual mobject for a unit at `offset`, only made once it's been placed.
+        It shares its points with every other unit until something changes them.
+        """
+        matrix, shift = self.layout_transform
+        unit = self.unit_template.copy()
+        for member in unit.get_family():
+            member.transform_instance(matrix, offset @ matrix.T + shift)
+        return unit
+
+    def shift(self, *vectors):
+        total_vector = sum(np.asarray(vector, dtype=float) for vector in vectors)
+        for mob in self.family_members_with_points():
+            if isinstance(mob, InstancedPoints) and mob.is_instanced():
+                mob.transform_instance(np.identity(3), total_vector)
+            else:
+                mob.points = mob.points.astype(float) + total_vector
+        self.follow_layout_transform(np.identity(3), total_vector)
+        return self
+
+    def apply_points_function_about_point(
+        self, func, about_point=None, about_edge=None
+    ):
+        """
+        Same as `Mobject`'s, except that linear maps (everything but
+        `apply_function` and the like) only update the transforms of units that
+        are still instanced rather than giving them all their own points.
+        """
+        if about_point is None:
+            if about_edge is None:
+                about_edge = ORIGIN
+            about_point = self.get_critical_point(about_edge)
+        about_point = np.array(about_point, dtype=float)
+
+        matrix = get_linear_map(func)
+        for mob in self.family_members_with_points():
+            if matrix is not None and isinstance(mob, InstancedPoints) and (
+                mob.is_instanced()
+            ):
+                mob.transform_instance(matrix, about_point - about_point @ matrix.T)
+            else:
+                mob.points -= about_point
+                mob.points = func(mob.points)
+                mob.points += about_point
+
+        if matrix is None:
+            self.layout_transform = None
+        else:
+            self.follow_layout_transform(matrix, about_point - about_point @ matrix.T)
+        return self
+
+
+class CompactPolymer(Polymer):
+    """
+    Same layout as `Polymer`, but rather than a group of thousands of unit copies
+    it's a single mobject whose points are every unit's points back to back in one
+    contiguous array, `points_per_unit` rows each. Moving, scaling etc. the whole
+    chain is then one numpy operation instead of a walk over a deep family tree.
+
+    `p[i]` (or `p.get_unit(i)`, or iterating over `p`) gives a `CompactPolymerUnit`
+    for when a scene needs to single a unit out, a view whose points are that
+    unit's rows of the chain. The whole chain is drawn in the base unit's style,
+    which is all chemfig output uses anyway, so a unit can only look different
+    while its view is on screen too. Growth can't be deferred, since the point
+    buffer is only assembled once the layout is done.
+    """
+
+    def __init__(self, base_unit: Union[str, ChemObject], *args, **kwargs):
+        self._unit_point_chunks = []
+        kwargs["defer_growth"] = False
+        super().__init__(base_unit, *args, **kwargs)
+
+        self.set_points(np.concatenate(self._unit_point_chunks))
+        self.match_style(self.base_unit.family_members_with_points()[0])
+        del self._unit_point_chunks
+
+    def make_unit_template(self, base_unit: ChemObject):
+        ## The units are rows of one point array, not mobjects of their own.
+        return None
+
+    @property
+    def base_points(self) -> np.ndarray:
+        if not hasattr(self, "_base_points"):
+            self._base_points = np.concatenate(
+                [mob.points for mob in self.base_unit.family_members_with_points()]
             )
+        return self._base_points
 
-        for item in self:
-            # print(overlap_exists(item, temp_base_unit_copy, self._overlap_check_tolerance))
-            if overlap_exists(item, temp_base_unit_copy, self._overlap_check_tolerance):
-                # ) or overlap_exists(item, self.base_unit, self._overlap_check_tolerance):
-                del temp_base_unit_copy
-                return
-        # self.repeatable_bases.append(temp_base_unit_copy)
+    @property
+    def points_per_unit(self) -> int:
+        return len(self.base_points)
+
+    @property
+    def num_units(self) -> int:
+        return len(self.layout.offsets)
+
+    def add_unit(self, offset: np.ndarray, unit: ChemObject = None):
+        self.layout.add(offset)
+        self._unit_point_chunks.append(self.base_points + offset)
+
+    def get_unit_points(self, index: int) -> np.ndarray:
+        return self.points[
+            index * self.points_per_unit : (index + 1) * self.points_per_unit
+        ]
+
+    def get_unit(self, index: int) -> "CompactPolymerUnit":
+        return self[index]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return VGroup(*[self[i] for i in range(*index.indices(len(self)))])
+        if not -len(self) <= index < len(self):
+            raise IndexError(f"CompactPolymer has {len(self)} units, not {index}.")
+        return CompactPolymerUnit(self, index % len(self))
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def __len__(self) -> int:
+        return self.num_units
+
+
+class CompactPolymerUnit(VMobject):
+    """
+    One unit of a `CompactPolymer`, as a view into its points: moving, scaling etc.
+    the unit moves that part of the chain, whatever the chain's been through since.
+    Its style is its own, though, see `CompactPolymer`. Copies (like the ones
+    animations make) are plain mobjects, detached from the chain.
+    """
+
+    def __init__(self, polymer: CompactPolymer, unit_index: int, **kwargs):
+        super().__init__(**kwargs)
+        self.polymer = polymer
+        self.unit_index = unit_index
+        self.match_style(polymer)
+
+    @property
+    def points(self) -> np.ndarray:
+        if "polymer" not in self.__dict__:
+            return np.zeros((0, 3))
+        return self.polymer.get_unit_points(self.unit_index)
+
+    @points.setter
+    def points(self, points: np.ndarray):
+        ## VMobject.__init__ resetting them, before there's a chain to write to.
+        if "polymer" not in self.__dict__:
+            return
+        unit_points = self.polymer.get_unit_points(self.unit_index)
+        if np.shape(points) != unit_points.shape:
+            raise ValueError(
+                "A unit of a CompactPolymer can't change how many points it has."
+            )
+        unit_points[:] = points
+
+    def __deepcopy__(self, memo):
+        return VMobject().set_points(self.points.copy()).match_style(self)
 
-        self.add(temp_base_unit_copy)
-        self.reps_done += 1
+
+class PolymerWave(LaggedStart):
+    """
+    Flashes the units of a `Polymer` in `color` one after another. It's all a single
+    animation, so a long chain gets rendered in one `play` call instead of one per
+    unit. `lag_ratio` below 1 makes the flashes overlap into more of a ripple.
+    """
+
+    def __init__(
+        self,
+        polymer: Polymer,
+        color=YELLOW,
+        run_time_per_unit=0.1,
+        lag_ratio=1,
+        **kwargs,
+    ):
+        if isinstance(polymer, CompactPolymer):
+            ## Its units can only be coloured by putting a view of each of them on
+            ## screen, which is everything CompactPolymer is there to avoid.
+            raise TypeError("PolymerWave needs a Polymer, not a CompactPolymer.")
+        super().__init__(
+            *[
+                unit.animate(
+                    rate_func=there_and_back, run_time=run_time_per_unit
+                ).set_color(color)
+                for unit in polymer
+            ],
+            lag_ratio=lag_ratio,
+            **kwargs,
+        )
 
 
 class PolymerTest(Scene):
@@ -229,7 +1041,11 @@ class PolymerTest(Scene):
         chem = ChemObject(Benzene)
         # self.add(chem,index_labels(chem[0]))
         p = Polymer(
-            chem, [0, 1, 3, 4, 6, 7], num_repetitions=135, include_base=True
+            chem,
+            [0, 1, 3, 4, 6, 7],
+            num_repetitions=135,
+            include_base=True,
+            cache_layout=True,
         ).scale(0.85)
 
         # self.add(
@@ -240,10 +1056,7 @@ class PolymerTest(Scene):
         #     self.play(Write(m))
         #     self.wait(0.5)
         # self.play(FadeIn(index_labels(p)))
-        for m in p:
-            self.play(
-                m.animate(rate_func=there_and_back, run_time=0.1).set_color(YELLOW)
-            )
+        self.play(PolymerWave(p))
         # self.add(p, index_labels(p))
 
 
@@ -253,7 +1066,7 @@ class PolymerTest2(Scene):
         # print(c[0][2].width)
         # c[0][2].stretch_to_fit_width(0.35).shift(RIGHT * 0.35)
         # self.add(c, index_labels(c[0]))
-        p = Polymer(c, [2, 4], 4)
+        p = Polymer(c, [2, 4], 4, cache_layout=True)
 
         self.add(p)
 
@@ -261,12 +1074,35 @@ class PolymerTest3(Scene):
     def construct(self):
         neoprene = ChemObject("-CH_2-C(-[-2]Cl)=CH-CH_2")
         # self.add(neoprene, index_labels(neoprene[0]))
-        p = Polymer(neoprene,[3,14],_overlap_check_tolerance=1.75)
+        p = Polymer(
+            neoprene, [3, 14], _overlap_check_tolerance=1.75, cache_layout=True
+        )
 
         self.play(Write(p))
         self.wait()
 
 
+class CompactPolymerTest(Scene):
+    def construct(self):
+        p = CompactPolymer(
+            ChemObject(Benzene), [0, 1, 3, 4, 6, 7], num_repetitions=1000
+        ).scale(0.25)
+
+        self.play(FadeIn(p))
+        self.play(Indicate(p.get_unit(0)))
+        self.wait()
+
+
+class PolymerGrowthTest(Scene):
+    def construct(self):
+        p = Polymer(ChemObject("-CH=CH"), [2, 4], 12, defer_growth=True)
+        self.add(p)
+
+        for unit in p.grow():
+            self.play(FadeIn(unit), run_time=0.25)
+        self.wait()
+
+
 class HindiTest(Scene):
     def construct(self):
         text = Text("नमस्ते, मेरा नाम राघव है।", font="Karma")
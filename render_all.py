@@ -0,0 +1,245 @@
+"""
+Renders every scene in the given files, as many at a time as there are cores.
+
+Each scene gets its own `manim render` process, so one crashing doesn't take the
+rest down with it, and its own log under `media/render_logs/<file>/<Scene>.log`.
+Anything not recognised here is passed on to manim as is.
+
+With `--split`, long scenes get spread over the cores too. A quick pass with every
+animation skipped counts each scene's `play`s, then workers render slices of them
+(`-n a,b`) into the partial movie cache (see rendering.py), each replaying
+`construct` with the plays outside its slice skipped. A last ordinary render finds
+every segment cached and just stitches them together. The slices' own short movies
+go to a temporary folder that's deleted once they're done.
+
+Usage:
+    python render_all.py luminol.py pinacol.py Markovnikoff_addition.py -ql
+    python render_all.py luminol.py --scenes LuminolIntro Synthesis --jobs 4 -qh
+    python render_all.py luminol.py --scenes LuminolInstagram --split -qh
+"""
+
+import argparse
+import importlib.util
+import inspect
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from multiprocessing import get_context
+from pathlib import Path
+
+from manim import Scene, config, tempconfig
+from rich.console import Console
+from rich.table import Table
+
+
+def load_scene_file(scene_file):
+    """
+    Imports `scene_file` the way manim does: registered in `sys.modules` (which
+    `inspect` needs to find a class's source) and with its folder on the path, so
+    it can import its neighbours.
+    """
+    scene_file = Path(scene_file).resolve()
+    if str(scene_file.parent) not in sys.path:
+        sys.path.insert(0, str(scene_file.parent))
+    spec = importlib.util.spec_from_file_location(scene_file.stem, scene_file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def find_scenes(scene_file) -> list:
+    """
+    Names of the `Scene` subclasses defined in `scene_file` (not the ones it
+    imports), in the order they're defined in.
+    """
+    module = load_scene_file(scene_file)
+    scenes = [
+        cls
+        for _, cls in inspect.getmembers(module, inspect.isclass)
+        if issubclass(cls, Scene) and cls.__module__ == module.__name__
+    ]
+    scenes.sort(key=lambda cls: inspect.getsourcelines(cls)[1])
+    return [cls.__name__ for cls in scenes]
+
+
+def count_plays(scene_file, scene_name: str) -> int:
+    """
+    How many times the scene calls `play` (or `wait`), found by running it with
+    every animation skipped and nothing written. Meant for a fresh process, since
+    it touches manim's global config.
+
+    Scenes that resume from a checkpoint count the same here as in the workers
+    whether or not the snapshot's there yet, since replaying the parent doesn't
+    count towards the scene's own plays (see `CheckpointMixin.replay_silently`).
+    """
+    with tempconfig({"dry_run": True, "input_file": str(scene_file)}):
+        scene = getattr(load_scene_file(scene_file), scene_name)()
+        scene.renderer._original_skipping_status = True
+        scene.render()
+        return scene.renderer.num_plays
+
+
+def get_log_file(scene_file, log_name: str) -> Path:
+    log_dir = Path(config.media_dir) / "render_logs" / Path(scene_file).stem
+    return log_dir / f"{log_name}.log"
+
+
+def render_scene(
+    scene_file, scene_name: str, manim_args: list, log_name: str = None
+) -> dict:
+    log_file = get_log_file(scene_file, log_name or scene_name)
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    with open(log_file, "w") as log:
+        returncode = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "manim",
+                "render",
+                *manim_args,
+                str(scene_file),
+                scene_name,
+            ],
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL,
+        ).returncode
+
+    return {
+        "file": str(scene_file),
+        "scene": scene_name,
+        "ok": returncode == 0,
+        "seconds": time.perf_counter() - start,
+        "log": log_file,
+    }
+
+
+def run_renders(pool, render_jobs: list, console) -> list:
+    futures = [pool.submit(render_scene, *render_job) for render_job in render_jobs]
+    results = []
+    for future in as_completed(futures):
+        result = future.result()
+        results.append(result)
+        status = "[green]done[/green]" if result["ok"] else "[red]FAILED[/red]"
+        console.print(
+            f"{status} {result['file']}:{result['scene']} ({result['seconds']:.1f}s)"
+        )
+    return results
+
+
+def render_slices(jobs: list, manim_args: list, num_workers: int, pool, console):
+    """
+    Renders every scene's plays in slices spread over `num_workers` workers, filling
+    the partial movie cache. Returns how long the slowest slice of each scene took.
+    """
+    ## Only the partial movies are needed for stitching, not the slices' own.
+    slice_dir = Path(tempfile.mkdtemp(prefix="render_slices_"))
+    with ProcessPoolExecutor(num_workers, mp_context=get_context("spawn")) as counters:
+        futures = {job: counters.submit(count_plays, *job) for job in jobs}
+    play_counts = {}
+    for job, future in futures.items():
+        try:
+            play_counts[job] = future.result()
+        except Exception as error:
+            ## The full render will fail on it too, and log why.
+            console.print(f"[red]Couldn't count the plays of {job[1]}:[/red] {error}")
+
+    render_jobs = []
+    for (scene_file, scene_name), num_plays in play_counts.items():
+        if not num_plays:
+            continue
+        slice_size = -(-num_plays // num_workers)
+        for first in range(0, num_plays, slice_size):
+            last = min(first + slice_size, num_plays) - 1
+            render_jobs.append(
+                (
+                    scene_file,
+                    scene_name,
+                    [
+                        *manim_args,
+                        "-n",
+                        f"{first},{last}",
+                        "-o",
+                        str(slice_dir / f"{scene_name}_plays_{first}_{last}"),
+                    ],
+                    f"{scene_name}.plays_{first}_{last}",
+                )
+            )
+    console.print(
+        f"Rendering {sum(play_counts.values())} plays in {len(render_jobs)} slices."
+    )
+
+    slice_times = {}
+    try:
+        for result in run_renders(pool, render_jobs, console):
+            key = (result["file"], result["scene"])
+            slice_times[key] = max(slice_times.get(key, 0), result["seconds"])
+    finally:
+        shutil.rmtree(slice_dir, ignore_errors=True)
+    return slice_times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("files", nargs="+")
+    parser.add_argument("--scenes", nargs="+", help="Only render these.")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "--split", action="store_true", help="Spread each scene's plays over the cores."
+    )
+    args, manim_args = parser.parse_known_args()
+
+    jobs = [
+        (scene_file, scene_name)
+        for scene_file in args.files
+        for scene_name in find_scenes(scene_file)
+        if args.scenes is None or scene_name in args.scenes
+    ]
+
+    console = Console()
+    console.print(f"Rendering {len(jobs)} scenes, {args.jobs} at a time.")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(args.jobs) as pool:
+        ## Threads are plenty here, the rendering itself happens in the manim
+        ## processes they start.
+        if args.split:
+            slice_times = render_slices(jobs, manim_args, args.jobs, pool, console)
+        results = run_renders(pool, [(*job, manim_args) for job in jobs], console)
+    total_time = time.perf_counter() - start
+
+    if args.split:
+        ## The scene's wall time is its slowest slice plus stitching it together.
+        for result in results:
+            result["seconds"] += slice_times.get((result["file"], result["scene"]), 0)
+
+    table = Table(title=f"Rendered in {total_time:.1f}s")
+    table.add_column("File")
+    table.add_column("Scene")
+    table.add_column("Status")
+    table.add_column("Wall time", justify="right")
+    table.add_column("Log")
+    results.sort(key=lambda result: jobs.index((result["file"], result["scene"])))
+    for result in results:
+        table.add_row(
+            result["file"],
+            result["scene"],
+            "[green]ok[/green]" if result["ok"] else "[red]failed[/red]",
+            f"{result['seconds']:.1f}s",
+            str(result["log"]),
+        )
+    console.print(table)
+
+    if not all(result["ok"] for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Render settings shared by the scene files.
+
+Manim already caches each `play` as a partial movie named after a hash of the
+camera, the animations and every mobject on screen right before it, which is all
+that decides what the segment looks like. The scene itself isn't part of the hash,
+it's only the per-scene partial movie folder that keeps, say, `NormalMarksAddition`
+and `NormalMarksAdditionWithoutFootnote` from reusing each other's segments.
+`enable_shared_render_cache` points every scene (in every file) at one folder, so
+any segment that's already been rendered anywhere gets spliced in instead. It's
+opt-in, render with `SHARED_RENDER_CACHE=1` set to turn it on.
+
+`StaticLayerScene` keeps things like the reference grid, which sit behind
+everything without ever moving, at the back of the scene.
+"""
+
+import os
+from pathlib import Path
+
+from manim import config
+from manim.scene import scene_file_writer
+from manim.scene.video_segment_encoder import VideoSegmentEncoder
+
+SHARED_PARTIAL_MOVIE_DIR = "{media_dir}/partial_movie_files/shared"
+## Manim's default of 100 is meant for a single scene.
+SHARED_MAX_FILES_CACHED = 10_000
+## What manim's default.cfg has for them, anything else was set on purpose.
+DEFAULT_PARTIAL_MOVIE_DIR = "{video_dir}/partial_movie_files/{scene_name}"
+DEFAULT_MAX_FILES_CACHED = 100
+
+
+class AtomicSegmentEncoder(VideoSegmentEncoder):
+    """
+    Encodes into a hidden temporary file and only moves it into place once it's
+    finished, so another render process never splices in half a segment.
+    """
+
+    def __init__(self, *, target: Path, spec):
+        temp_target = target.with_name(f".{target.stem}.{os.getpid()}{target.suffix}")
+        super().__init__(target=temp_target, spec=spec)
+        self.temp_target, self.target = temp_target, target
+
+    def finish(self):
+        super().finish()
+        os.replace(self.temp_target, self.target)
+
+    def abort(self):
+        ## Don't let the base class delete a finished segment someone else wrote.
+        self.target = self.temp_target
+        super().abort()
+
+
+def enable_shared_render_cache(force=False):
+    """
+    Has all scenes rendered from here on share one partial movie cache, if the
+    `SHARED_RENDER_CACHE` environment variable is set to 1 (or `force` is). Call it
+    at the top of a scene file. A `partial_movie_dir` or `max_files_cached` set in
+    a manim.cfg or on the command line is left as it is.
+    """
+    if not force and os.environ.get("SHARED_RENDER_CACHE") != "1":
+        return
+    if config.partial_movie_dir == DEFAULT_PARTIAL_MOVIE_DIR:
+        config.partial_movie_dir = SHARED_PARTIAL_MOVIE_DIR
+    if config.max_files_cached == DEFAULT_MAX_FILES_CACHED:
+        config.max_files_cached = SHARED_MAX_FILES_CACHED
+    scene_file_writer.VideoSegmentEncoder = AtomicSegmentEncoder
+
+
+## Static layers ##
+
+
+class StaticLayerScene:
+    """
+    Goes in front of `Scene` (or whatever Scene subclass) in the bases.
+
+    Mobjects passed to `add_static` go behind everything else on screen. There's
+    no need to draw them any differently: manim already draws whatever an
+    animation doesn't touch once per `play`, rather than every frame (see
+    `save_static_frame_data`).
+    """
+
+    def add_static(self, *mobjects):
+        self.bring_to_back(*mobjects)
+
+    def remove_static(self, *mobjects):
+        self.remove(*mobjects)